@@ -15,7 +15,6 @@ import time
 import logging
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional
-import importlib.util
 
 # Add config and scripts to path
 sys.path.extend([
@@ -28,10 +27,7 @@ import api_config  # This sets up OpenRouter API key in environment
 from automation import AUTOMATION_CONFIG
 from smart_scraper import SmartScraper
 from quality_curator import AutomatedCurator
-spec = importlib.util.spec_from_file_location("AI_Engine", os.path.join(os.path.dirname(__file__), "scripts", "AI-Engine.py"))
-AI_Engine = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(AI_Engine)
-CostOptimizedAIProcessor = AI_Engine.CostOptimizedAIProcessor
+from ai_engine import CostOptimizedAIProcessor
 from website_updater import LiveWebsiteUpdater
 
 # Configure logging
@@ -2,31 +2,70 @@
 # Builds on proven manual system architecture with enhanced automation
 
 import os
+import json
+import sys
+from dataclasses import dataclass, fields
 from datetime import datetime, timezone
 
+try:
+    import msgspec  # Optional: Rust-backed JSON encoding for config export
+except ImportError:
+    msgspec = None
+
+# 🧵 KEYWORD POOL
+# Keyword lists overlap heavily across configs ('gouvernement', 'président', ...).
+# Interning them through one pool keeps a single string object per keyword.
+_KEYWORD_POOL = {}
+
+def _pooled(keyword):
+    """Return the shared, interned, lower-cased instance of a keyword"""
+    keyword = keyword.lower()
+    return _KEYWORD_POOL.setdefault(keyword, sys.intern(keyword))
+
+def _keyword_tuple(keywords):
+    """Ordered, immutable keyword collection drawn from the shared pool"""
+    return tuple(_pooled(k) for k in keywords)
+
+def _keyword_set(keywords):
+    """Frozen keyword set drawn from the shared pool"""
+    return frozenset(_pooled(k) for k in keywords)
+
+# 🧊 SEALED CONFIG VIEWS
+# Hot, read-only settings are exposed as frozen slotted dataclasses so callers
+# get attribute access without dict lookups; the *_CONFIG dicts are kept for
+# existing code and JSON export.
+@dataclass(frozen=True, slots=True)
+class _SealedConfig:
+    def to_dict(self):
+        """Plain dict view of this config (for JSON export and legacy callers)"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
 # 🔄 SCHEDULING CONFIGURATION
-SCHEDULING_CONFIG = {
+@dataclass(frozen=True, slots=True)
+class SchedulingConfig(_SealedConfig):
     # Breaking news monitoring (urgent updates)
-    'breaking_news_interval': 30,  # minutes
-    'breaking_news_keywords': [
+    breaking_news_interval: int = 30  # minutes
+    breaking_news_keywords: tuple = _keyword_tuple([
         'breaking', 'urgent', 'alerte', 'exclusif', 'dernière minute',
         'gouvernement', 'président', 'élection', 'crise', 'attentat',
         'manifestation', 'grève nationale', 'état d\'urgence'
-    ],
+    ])
     
     # Regular content updates
-    'regular_update_interval': 120,  # minutes (every 2 hours)
-    'business_hours': list(range(6, 23)),  # 6 AM to 10 PM
-    'weekend_reduced_frequency': True,
+    regular_update_interval: int = 120  # minutes (every 2 hours)
+    business_hours: tuple = tuple(range(6, 23))  # 6 AM to 10 PM
+    weekend_reduced_frequency: bool = True
     
     # AI processing schedule (cost optimization)
-    'ai_processing_time': '02:00',  # Daily at 2 AM
-    'ai_processing_days': ['monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday'],
+    ai_processing_time: str = '02:00'  # Daily at 2 AM
+    ai_processing_days: tuple = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
     
     # Website update frequency
-    'website_update_interval': 5,  # minutes (for new content)
-    'website_full_refresh': 60,   # minutes (complete refresh)
-}
+    website_update_interval: int = 5  # minutes (for new content)
+    website_full_refresh: int = 60   # minutes (complete refresh)
+
+SCHEDULING = SchedulingConfig()
+SCHEDULING_CONFIG = SCHEDULING.to_dict()
 
 # 🎯 QUALITY STANDARDS (Inherited from proven manual system)
 QUALITY_CONFIG = {
@@ -37,7 +76,7 @@ QUALITY_CONFIG = {
     'min_importance_score': 5.5,    # News importance (0-10)
     
     # Expat/immigrant relevance keywords (from original curator)
-    'high_relevance_keywords': {
+    'high_relevance_keywords': _keyword_set({
         # Immigration & Legal (HIGH PRIORITY)
         'immigration', 'visa', 'carte de séjour', 'naturalisation', 'préfecture', 
         'titre de séjour', 'étranger', 'expatrié', 'résidence', 'citoyenneté',
@@ -56,9 +95,9 @@ QUALITY_CONFIG = {
         'gouvernement', 'président', 'assemblée nationale', 'sénat', 'maire',
         'conseil municipal', 'région', 'département', 'commune', 'élection',
         'réforme', 'loi', 'décret', 'politique sociale',
-    },
+    }),
     
-    'medium_relevance_keywords': {
+    'medium_relevance_keywords': _keyword_set({
         # National Events & News (MEDIUM PRIORITY)
         'france', 'français', 'national', 'pays', 'état', 'société',
         'population', 'citoyen', 'public', 'social', 'communauté',
@@ -66,70 +105,85 @@ QUALITY_CONFIG = {
         # Current Affairs (MEDIUM PRIORITY)
         'actualité', 'information', 'débat', 'polémique', 'manifestation',
         'grève', 'syndical', 'droit', 'justice', 'tribunal',
-    },
+    }),
     
     # Quality exclusion criteria (from original system)
-    'exclusion_keywords': {
+    'exclusion_keywords': _keyword_set({
         'people', 'célébrité', 'star', 'télé-réalité', 'scandale',
         'paparazzi', 'instagram', 'tiktok', 'influenceur',
         'gossip', 'rumeur', 'vie privée', 'buzz', 'choc'
-    },
+    }),
     
     # Quality trends monitoring
     'quality_trend_window': 7,      # days to track quality trends
     'quality_decline_threshold': 0.5,  # alert if avg drops by this much
+    
+    # Duplicate detection (MinHash LSH narrows the title pairs compared, needs datasketch)
+    'duplicate_lsh_threshold': 0.4,    # shingle Jaccard for candidate pairs; kept well below the 0.7 title similarity
+    'duplicate_lsh_min_articles': 50,  # smaller batches are compared pairwise
+    
+    # Feature extraction threads in full_curation (regex/keyword scans hold the GIL on standard
+    # CPython, so >1 only pays off on free-threaded builds)
+    'scoring_workers': 1,
+    'scoring_chunk_size': 32,          # articles handed to a worker at a time
 }
 
 # 💰 COST OPTIMIZATION CONFIGURATION
-COST_CONFIG = {
+@dataclass(frozen=True, slots=True)
+class CostConfig(_SealedConfig):
     # AI processing strategy (QUALITY-FIRST approach)
-    'enable_realtime_ai_processing': True,    # NEW: Process all articles with AI
-    'max_ai_articles_per_day': 100,           # Increased from 15 to 100
-    'max_ai_calls_per_day': 120,              # API call limit
-    'ai_batch_size': 5,                       # Process in batches
+    enable_realtime_ai_processing: bool = True    # NEW: Process all articles with AI
+    max_ai_articles_per_day: int = 100            # Increased from 15 to 100
+    max_ai_calls_per_day: int = 120               # API call limit
+    ai_batch_size: int = 5                        # Process in batches
     
     # Smart processing tiers
-    'breaking_news_ai_priority': True,        # NEW: Always process breaking news
-    'regular_updates_ai_enabled': True,       # NEW: Process regular updates
-    'quality_threshold_for_ai': 15.0,         # Only process articles scoring 15+/30
+    breaking_news_ai_priority: bool = True        # NEW: Always process breaking news
+    regular_updates_ai_enabled: bool = True       # NEW: Process regular updates
+    quality_threshold_for_ai: float = 15.0        # Only process articles scoring 15+/30
     
     # Smart caching system
-    'enable_smart_caching': True,
-    'cache_similarity_threshold': 0.85,       # Reuse if 85% similar
-    'cache_retention_days': 30,               # Keep cache for 30 days
+    enable_smart_caching: bool = True
+    cache_similarity_threshold: float = 0.85      # Reuse if 85% similar
+    cache_retention_days: int = 30                # Keep cache for 30 days
     
     # Cost monitoring (adjusted for higher usage)
-    'daily_cost_limit': 25.0,                 # Increased from $10 to $25 USD per day
-    'cost_alert_threshold': 20.0,             # Alert at 80% of limit
-    'emergency_stop_cost': 30.0,              # Emergency stop at this cost
+    daily_cost_limit: float = 25.0                # Increased from $10 to $25 USD per day
+    cost_alert_threshold: float = 20.0            # Alert at 80% of limit
+    emergency_stop_cost: float = 30.0             # Emergency stop at this cost
     
     # Fallback strategies
-    'fallback_to_curated_only': True,         # Serve without AI if costs high
-    'reduced_processing_mode': True,          # Emergency cost reduction
-}
+    fallback_to_curated_only: bool = True         # Serve without AI if costs high
+    reduced_processing_mode: bool = True          # Emergency cost reduction
+
+COST = CostConfig()
+COST_CONFIG = COST.to_dict()
 
 # 🛡️ RELIABILITY CONFIGURATION
-RELIABILITY_CONFIG = {
+@dataclass(frozen=True, slots=True)
+class ReliabilityConfig(_SealedConfig):
     # Error handling thresholds
-    'max_source_failures': 3,          # Max failures before disabling source
-    'retry_delay_minutes': 15,         # Wait before retrying failed source
-    'max_consecutive_failures': 5,     # Max before emergency fallback
+    max_source_failures: int = 3          # Max failures before disabling source
+    retry_delay_minutes: int = 15         # Wait before retrying failed source
+    max_consecutive_failures: int = 5     # Max before emergency fallback
     
     # System health monitoring
-    'health_check_interval': 10,       # minutes
-    'performance_alert_threshold': 2.0, # seconds for slow operations
-    'memory_usage_limit': 85,          # percent
+    health_check_interval: int = 10       # minutes
+    performance_alert_threshold: float = 2.0  # seconds for slow operations
+    memory_usage_limit: int = 85          # percent
     
     # Fallback mechanisms
-    'enable_manual_fallback': True,    # Fallback to manual system
-    'auto_recovery_attempts': 3,       # Auto-recovery tries
-    'emergency_contact_enabled': False, # Email alerts (configure separately)
+    enable_manual_fallback: bool = True   # Fallback to manual system
+    auto_recovery_attempts: int = 3       # Auto-recovery tries
+    emergency_contact_enabled: bool = False  # Email alerts (configure separately)
     
     # Data integrity
-    'validate_article_structure': True,
-    'check_data_freshness': True,
-    'max_article_age_hours': 48,       # Alert if no new articles
-}
+    validate_article_structure: bool = True
+    check_data_freshness: bool = True
+    max_article_age_hours: int = 48       # Alert if no new articles
+
+RELIABILITY = ReliabilityConfig()
+RELIABILITY_CONFIG = RELIABILITY.to_dict()
 
 # 🌐 WEBSITE UPDATE CONFIGURATION  
 WEBSITE_CONFIG = {
@@ -167,6 +221,9 @@ MONITORING_CONFIG = {
     'log_level': 'INFO',               # DEBUG, INFO, WARNING, ERROR
     'log_retention_days': 30,
     'max_log_file_size_mb': 100,
+    'metrics_file': 'metrics.json',    # in logs/; name it metrics.json.gz for gzip output
+    'resource_sample_interval_sec': 2, # CPU/memory sampling rate while background monitoring runs
+    'resource_sample_window': 900,     # samples kept for averaging (900 x 2s = 30 minutes)
     
     # Alert thresholds
     'alert_on_quality_drop': True,
@@ -208,6 +265,8 @@ AI_PROCESSING_CONFIG = {
     
     # Rate limiting and cost control
     'rate_limit_delay': 2.0,           # seconds between API calls
+    'max_concurrent_requests': 4,      # in-flight API calls for async batches
+    'titles_per_call': 5,              # article titles explained per API call (1 = one call per title)
     'batch_processing': True,
     'retry_attempts': 3,
     'timeout_seconds': 30,
@@ -297,6 +356,19 @@ SCRAPING_CONFIG = {
     'retry_delay_minutes': 30,                 # Wait time before retry
 }
 
+# ⏱️ DERIVED THRESHOLDS (seconds)
+# Precomputed so hot age checks are plain number comparisons against time.time()
+BREAKING_NEWS_TIMEFRAME_SEC = SCRAPING_CONFIG['breaking_news_timeframe_hours'] * 3600
+REGULAR_UPDATE_TIMEFRAME_SEC = SCRAPING_CONFIG['regular_update_timeframe_hours'] * 3600
+MAX_ARTICLE_AGE_SEC = SCRAPING_CONFIG['max_article_age_hours'] * 3600
+DEDUP_CACHE_DURATION_SEC = SCRAPING_CONFIG['cache_duration_hours'] * 3600
+SOURCE_RETRY_DELAY_SEC = SCRAPING_CONFIG['retry_delay_minutes'] * 60
+DATA_FRESHNESS_MAX_AGE_SEC = RELIABILITY.max_article_age_hours * 3600
+HEALTH_CHECK_INTERVAL_SEC = RELIABILITY.health_check_interval * 60
+BREAKING_NEWS_INTERVAL_SEC = SCHEDULING.breaking_news_interval * 60
+REGULAR_UPDATE_INTERVAL_SEC = SCHEDULING.regular_update_interval * 60
+WEBSITE_UPDATE_INTERVAL_SEC = SCHEDULING.website_update_interval * 60
+
 def get_config_summary():
     """Get a summary of current automation configuration"""
     return {
@@ -315,12 +387,12 @@ def get_config_summary():
         'deployment_ready': True
     }
 
-def validate_configuration():
-    """Validate that all configuration values are sensible"""
+def _collect_configuration_issues():
+    """Run the configuration sanity checks and return any issues found"""
     issues = []
     
     # Check scheduling makes sense
-    if SCHEDULING_CONFIG['breaking_news_interval'] > SCHEDULING_CONFIG['regular_update_interval']:
+    if SCHEDULING.breaking_news_interval > SCHEDULING.regular_update_interval:
         issues.append("Breaking news interval should be shorter than regular updates")
     
     # Check quality thresholds are reasonable
@@ -328,10 +400,22 @@ def validate_configuration():
         issues.append("Total quality score cannot exceed 30 (max possible)")
     
     # Check cost limits are reasonable
-    if COST_CONFIG['max_ai_articles_per_day'] < 5:
+    if COST.max_ai_articles_per_day < 5:
         issues.append("Minimum 5 articles needed for meaningful content")
     
-    return issues if issues else ["Configuration is valid"]
+    return tuple(issues)
+
+# Config is static, so checks run once at import; `python -O` skips them here
+# and validate_configuration() falls back to checking on demand.
+_VALIDATION_RESULT = _collect_configuration_issues() if __debug__ else None
+
+def validate_configuration():
+    """Validate that all configuration values are sensible"""
+    issues = _VALIDATION_RESULT
+    if issues is None:
+        issues = _collect_configuration_issues()
+    
+    return list(issues) if issues else ["Configuration is valid"]
 
 # Export main configuration object
 AUTOMATION_CONFIG = {
@@ -347,4 +431,20 @@ AUTOMATION_CONFIG = {
     'security': SECURITY_CONFIG,
     'scraping': SCRAPING_CONFIG,
     'meta': get_config_summary()
-} 
\ No newline at end of file
+} 
+
+def _json_default(obj):
+    """Fallback encoder for config values stdlib json can't handle"""
+    if isinstance(obj, (set, frozenset)):
+        return sorted(obj)
+    if isinstance(obj, _SealedConfig):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def config_to_json(config=None):
+    """Encode a configuration (default: AUTOMATION_CONFIG) to JSON bytes"""
+    if config is None:
+        config = AUTOMATION_CONFIG
+    if msgspec is not None:
+        return msgspec.json.encode(config, order='sorted')
+    return json.dumps(config, ensure_ascii=False, sort_keys=True, default=_json_default).encode('utf-8')
@@ -11,6 +11,7 @@ import json
 import webbrowser
 import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add the current directory to the path for imports
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,18 +22,16 @@ sys.path.extend([scripts_dir, config_dir])
 # Set up API configuration first
 import api_config
 
-# Import system components using new AI-Engine filename
-from scripts.smart_scraper import SmartScraper
+# Import system components
+from scripts.smart_scraper import SmartScraper, simhash64, is_near_duplicate, warm_up_simhash
 from scripts.quality_curator import AutomatedCurator
-import importlib.util
-spec = importlib.util.spec_from_file_location("AI_Engine", os.path.join(scripts_dir, "AI-Engine.py"))
-AI_Engine = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(AI_Engine)
-CostOptimizedAIProcessor = AI_Engine.CostOptimizedAIProcessor
+from scripts.ai_engine import CostOptimizedAIProcessor
 from scripts.website_updater import LiveWebsiteUpdater
 from config.automation import AUTOMATION_CONFIG
 from scripts.monitoring import SystemMonitor
 
+os.makedirs("logs", exist_ok=True)
+
 class BetterFrenchMaxDemo:
     """Complete demonstration of the automated system"""
     
@@ -44,25 +43,34 @@ class BetterFrenchMaxDemo:
         self.results = {}
         self.demo_start_time = time.time()
         
+        # Compile the SimHash kernel now so Step 2 doesn't pay for it (warm_up_simhash is the
+        # module smart_scraper itself imported, not a second copy under the scripts package)
+        warm_up_simhash()
+        
     def step1_initialize_components(self):
         """Step 1: Initialize all automation components"""
         print("\n📦 Step 1: Initializing Automation Components...")
         
+        # Components are independent, so construct them concurrently
+        component_ctors = {
+            'scraper': (SmartScraper, "Smart Scraper"),
+            'curator': (AutomatedCurator, "Quality Curator"),
+            'ai_processor': (CostOptimizedAIProcessor, "AI Processor"),
+            'website_updater': (LiveWebsiteUpdater, "Website Updater"),
+            'monitor': (SystemMonitor, "System Monitor"),
+        }
+        
         try:
-            self.components['scraper'] = SmartScraper()
-            print("   ✅ Smart Scraper ready")
-            
-            self.components['curator'] = AutomatedCurator()
-            print("   ✅ Quality Curator ready")
-            
-            self.components['ai_processor'] = CostOptimizedAIProcessor()
-            print("   ✅ AI Processor ready")
-            
-            self.components['website_updater'] = LiveWebsiteUpdater()
-            print("   ✅ Website Updater ready")
-            
-            self.components['monitor'] = SystemMonitor()
-            print("   ✅ System Monitor ready")
+            with ThreadPoolExecutor(max_workers=len(component_ctors)) as executor:
+                future_to_name = {
+                    executor.submit(ctor): name
+                    for name, (ctor, _) in component_ctors.items()
+                }
+                
+                for future in as_completed(future_to_name):
+                    name = future_to_name[future]
+                    self.components[name] = future.result()
+                    print(f"   ✅ {component_ctors[name][1]} ready")
             
             print("🎯 All components initialized successfully!")
             
@@ -76,28 +84,46 @@ class BetterFrenchMaxDemo:
         
         scraper = self.components['scraper']
         
-        # Quick breaking news scan
+        # Breaking news scan plus recent articles from top sources, fetched concurrently
+        demo_feeds = ["France Info", "Le Monde"]
         print("   🔥 Scanning for breaking news...")
-        breaking_articles = scraper.quick_breaking_news_scan([])
-        
-        # Get some recent articles from top sources  
-        print("   📺 Getting recent articles from France Info...")
-        france_info_articles = scraper.scrape_single_feed("France Info", scraper.feed_urls["France Info"])
-        
-        print("   📰 Getting recent articles from Le Monde...")
-        le_monde_articles = scraper.scrape_single_feed("Le Monde", scraper.feed_urls["Le Monde"])
-        
-        # Combine all articles
-        all_articles = breaking_articles + france_info_articles + le_monde_articles
-        
-        # Remove duplicates by title
+        for feed_name in demo_feeds:
+            print(f"   📰 Getting recent articles from {feed_name}...")
+        
+        results_by_task = {}
+        with ThreadPoolExecutor(max_workers=len(demo_feeds) + 1) as executor:
+            future_to_task = {executor.submit(scraper.quick_breaking_news_scan, []): 'breaking'}
+            for feed_name in demo_feeds:
+                future = executor.submit(scraper.scrape_single_feed, feed_name, scraper.feed_urls[feed_name])
+                future_to_task[future] = feed_name
+            
+            for future in as_completed(future_to_task):
+                task = future_to_task[future]
+                try:
+                    results_by_task[task] = future.result()
+                except Exception as e:
+                    print(f"   ⚠️ Scraping failed for {task}: {e}")
+                    results_by_task[task] = []
+        
+        # Combine all articles (breaking news first, as before)
+        all_articles = []
+        for task in ['breaking'] + demo_feeds:
+            all_articles.extend(results_by_task[task])
+        
+        # Remove duplicates by title (exact match first, then SimHash near-duplicates)
         unique_articles = []
         seen_titles = set()
+        seen_fingerprints = []
         for article in all_articles:
             title = article.title.lower()
-            if title not in seen_titles:
-                unique_articles.append(article)
-                seen_titles.add(title)
+            if title in seen_titles:
+                continue
+            fingerprint = simhash64(title)
+            if is_near_duplicate(fingerprint, seen_fingerprints):
+                continue
+            unique_articles.append(article)
+            seen_titles.add(title)
+            seen_fingerprints.append(fingerprint)
         
         self.results['scraped_articles'] = unique_articles
         self.results['breaking_count'] = len([a for a in unique_articles if a.breaking_news])
@@ -122,19 +148,22 @@ class BetterFrenchMaxDemo:
         
         print(f"   📊 Curating {len(articles)} articles...")
         
-        # Convert to dict format for curation
-        article_dicts = [article.__dict__ for article in articles]
-        
-        # Run full curation
-        curated_articles = curator.full_curation(article_dicts)
+        # Run full curation (the curator reads scraped article objects directly)
+        curated_articles = curator.full_curation(articles)
         
         self.results['curated_articles'] = curated_articles
         
         if curated_articles:
-            avg_score = sum(a.total_score for a in curated_articles) / len(curated_articles)
-            best_article = max(curated_articles, key=lambda x: x.total_score)
+            # Count, total and best score in a single pass
+            n, total, best_article = 0, 0.0, None
+            for a in curated_articles:
+                n += 1
+                total += a.total_score
+                if best_article is None or a.total_score > best_article.total_score:
+                    best_article = a
+            avg_score = total / n if n else 0.0
             
-            print(f"   ✅ Articles approved: {len(curated_articles)}")
+            print(f"   ✅ Articles approved: {n}")
             print(f"   📈 Average quality score: {avg_score:.1f}/30")
             print(f"   🏆 Best article score: {best_article.total_score:.1f}/30")
             print(f"   🎯 Best article: {best_article.original_data.get('title', '')[:50]}...")
@@ -163,10 +192,12 @@ class BetterFrenchMaxDemo:
                 # Create mock processed articles for demo
                 processed_articles = []
                 for i, article in enumerate(demo_articles):
+                    original_title = article.original_data.get('title', '')
+                    title_head = original_title[:50]
                     mock_processed = {
-                        'original_article_title': article.original_data.get('title', ''),
-                        'simplified_french_title': f"Version simplifiée: {article.original_data.get('title', '')[:50]}...",
-                        'simplified_english_title': f"Simplified: {article.original_data.get('title', '')[:50]}...",
+                        'original_article_title': original_title,
+                        'simplified_french_title': f"Version simplifiée: {title_head}...",
+                        'simplified_english_title': f"Simplified: {title_head}...",
                         'french_summary': "Résumé en français simplifié pour les expatriés.",
                         'english_summary': "Simplified English summary for expats.",
                         'source_name': article.original_data.get('source_name', ''),
@@ -182,9 +213,8 @@ class BetterFrenchMaxDemo:
                 print(f"   📝 Mock AI processing completed: {len(processed_articles)} articles")
             else:
                 # Convert ScoredArticle objects to format expected by AI processor
-                ai_candidates = []
-                for scored_article in demo_articles:
-                    article_for_ai = {
+                ai_candidates = [
+                    {
                         'original_data': scored_article.original_data,
                         'quality_score': scored_article.quality_score,
                         'relevance_score': scored_article.relevance_score,
@@ -194,40 +224,19 @@ class BetterFrenchMaxDemo:
                         'curated_at': scored_article.curated_at,
                         'fast_tracked': scored_article.fast_tracked
                     }
-                    ai_candidates.append(article_for_ai)
+                    for scored_article in demo_articles
+                ]
                 
-                # Real AI processing
-                processed_articles = ai_processor.batch_process_articles(ai_candidates)
-                
-                # Convert to dict format for website
-                processed_dicts = []
-                for article in processed_articles:
-                    processed_dicts.append({
-                        'original_article_title': article.original_article_title,
-                        'original_article_link': article.original_article_link,
-                        'original_article_published_date': article.original_article_published_date,
-                        'simplified_french_title': article.simplified_french_title,
-                        'simplified_english_title': article.simplified_english_title,
-                        'french_summary': article.french_summary,
-                        'english_summary': article.english_summary,
-                        'contextual_title_explanations': article.contextual_title_explanations,
-                        'key_vocabulary': article.key_vocabulary,
-                        'cultural_context': article.cultural_context,
-                        'source_name': article.source_name,
-                        'quality_scores': article.quality_scores,
-                        'curation_metadata': article.curation_metadata,
-                        'ai_enhanced': True,
-                        'processing_id': article.processing_id,
-                        'processed_at': article.processed_at
-                    })
+                # Real AI processing (concurrent requests, website dicts built as results land)
+                processed_dicts = list(ai_processor.batch_process_articles_as_dicts(ai_candidates))
                 
                 self.results['ai_processed_articles'] = processed_dicts
-                print(f"   ✨ AI processing completed: {len(processed_articles)} articles")
+                print(f"   ✨ AI processing completed: {len(processed_dicts)} articles")
                 
-                if processed_articles:
-                    sample = processed_articles[0]
-                    print(f"   🇫🇷 Sample French: {sample.simplified_french_title[:50]}...")
-                    print(f"   🇬🇧 Sample English: {sample.simplified_english_title[:50]}...")
+                if processed_dicts:
+                    sample = processed_dicts[0]
+                    print(f"   🇫🇷 Sample French: {sample['simplified_french_title'][:50]}...")
+                    print(f"   🇬🇧 Sample English: {sample['simplified_english_title'][:50]}...")
         
         except Exception as e:
             print(f"   ❌ AI processing failed: {e}")
@@ -294,12 +303,9 @@ class BetterFrenchMaxDemo:
         demo_duration = time.time() - self.demo_start_time
         print(f"   ⏱️ Demo Duration: {demo_duration:.2f} seconds")
         
-        # Generate comprehensive report
-        report = monitor.generate_health_report()
+        # Generate comprehensive report (streamed line by line)
         report_file = "logs/demo_health_report.txt"
-        os.makedirs("logs", exist_ok=True)
-        with open(report_file, 'w') as f:
-            f.write(report)
+        monitor.write_health_report(report_file)
         
         print(f"   📋 Full report saved: {report_file}")
         
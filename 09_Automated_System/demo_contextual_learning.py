@@ -8,10 +8,19 @@ Shows how French word explanations work for the title:
 import json
 import sys
 import os
+from functools import lru_cache
+from pathlib import Path
 
 # Add scripts directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), 'scripts'))
 
+FIXTURE_FILE = Path(__file__).parent / "fixtures" / "contextual_demo.json"
+
+@lru_cache(maxsize=1)
+def _load_contextual_explanations():
+    """Load the static contextual explanation fixture (parsed once per process)"""
+    return json.loads(FIXTURE_FILE.read_bytes())
+
 def demo_contextual_learning():
     """Demonstrate what contextual learning would look like"""
     
@@ -24,32 +33,7 @@ def demo_contextual_learning():
     print()
     
     # This is what the AI would generate for contextual learning
-    contextual_explanations = [
-        {
-            "original_word": "Je voterai",
-            "display_format": "**Je voterai:** I will vote",
-            "explanation": "Future tense of 'voter' (to vote). In French politics, public declarations of voting intentions are common. Simple future tense: je + verb stem + -ai ending",
-            "cultural_note": "Public voting declarations are standard practice in French political discourse"
-        },
-        {
-            "original_word": "chèque en blanc",
-            "display_format": "**Chèque en blanc:** Blank check",
-            "explanation": "Literal: 'blank check'. Figurative: unconditional support without conditions. Fixed expression - always 'chèque en blanc', never changes",
-            "cultural_note": "French political expression meaning giving someone complete freedom to act"
-        },
-        {
-            "original_word": "ardoise magique",
-            "display_format": "**Ardoise magique:** Magic slate/Etch-a-Sketch",
-            "explanation": "Literal: 'magic slate' (toy where you can erase and start over). Figurative: wiping the slate clean, starting fresh. Feminine noun: 'une ardoise magique'",
-            "cultural_note": "French political metaphor for ignoring past mistakes or positions"
-        },
-        {
-            "original_word": "ce n'est ni... ni...",
-            "display_format": "**Ce n'est ni... ni...:** It is neither... nor...",
-            "explanation": "Double negative construction meaning 'it is neither X nor Y'. Both parts must be included - common way to deny two things at once in French political discourse",
-            "cultural_note": ""
-        }
-    ]
+    contextual_explanations = _load_contextual_explanations()
     
     print("🎓 CONTEXTUAL WORD EXPLANATIONS:")
     print("=" * 40)
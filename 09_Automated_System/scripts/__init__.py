@@ -0,0 +1 @@
+"""Better French Max - automation scripts package"""
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Better French Max - Curator Score Kernel
+The manual system's quality/relevance/importance formulas over pre-extracted article features,
+JIT-compiled for whole batches
+"""
+
+from typing import Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit, prange  # Optional: native batch scoring
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    njit = None
+    prange = range
+    _NUMBA_AVAILABLE = False
+
+# Feature columns (see AutomatedCurator._score_features)
+F_LONG_CONTENT = 0        # content longer than 200 chars
+F_LONG_SUMMARY = 1        # summary longer than 50 chars
+F_HAS_AUTHOR = 2
+F_QUALITY_GROUPS = 3      # quality indicator categories present (0-4)
+F_DESCRIPTIVE_TITLE = 4   # title has 5+ words
+F_FRENCH_PUNCT = 5        # ':', '«' or '»' in title
+F_UNIQUE_SUMMARY = 6
+F_FRENCH_KINDS = 7        # French structure kinds present (0-3)
+F_POOR_QUALITY = 8
+F_SHORT_TEXT = 9          # combined text under 100 chars
+F_CAPS_TITLE = 10
+F_HIGH_RELEVANCE = 11     # distinct high relevance keywords
+F_MEDIUM_RELEVANCE = 12   # distinct medium relevance keywords
+F_RELEVANT_CATEGORY = 13
+F_LOW_RELEVANCE = 14      # distinct low relevance keywords
+F_INTERNATIONAL = 15      # international story without French context
+F_HIGH_IMPORTANCE = 16
+F_POLICY = 17
+F_ECONOMIC = 18
+F_SOCIAL = 19
+F_REPUTABLE_SOURCE = 20
+F_LOCAL = 21              # local story outside the major cities
+N_FEATURES = 22
+
+def score_features(f) -> Tuple[float, float, float]:
+    """(quality, relevance, importance) of one feature row - EXACT same formulas as manual system"""
+    # Quality (0-10)
+    quality = 5.0  # Base score
+    
+    # 1. Content completeness (+2)
+    if f[F_LONG_CONTENT] != 0:
+        quality += 1.0
+    if f[F_LONG_SUMMARY] != 0:
+        quality += 0.5
+    if f[F_HAS_AUTHOR] != 0:
+        quality += 0.5
+    
+    # 2. Writing quality indicators (+2)
+    for _ in range(int(f[F_QUALITY_GROUPS])):
+        quality += 0.5
+    
+    # 3. Structure quality (+1)
+    if f[F_DESCRIPTIVE_TITLE] != 0:
+        quality += 0.3
+    if f[F_FRENCH_PUNCT] != 0:
+        quality += 0.2
+    if f[F_UNIQUE_SUMMARY] != 0:
+        quality += 0.5
+    
+    # 4. Language quality (+1)
+    quality += min(1.0, f[F_FRENCH_KINDS] * 0.2)
+    
+    # Penalties: poor quality indicators, too short content, all caps title
+    if f[F_POOR_QUALITY] != 0:
+        quality -= 1.0
+    if f[F_SHORT_TEXT] != 0:
+        quality -= 1.0
+    if f[F_CAPS_TITLE] != 0:
+        quality -= 0.5
+    
+    # Relevance (0-10)
+    relevance = 3.0  # Base score for French news
+    relevance += min(4.0, f[F_HIGH_RELEVANCE] * 0.8)   # High relevance for expat life (+4)
+    relevance += min(2.0, f[F_MEDIUM_RELEVANCE] * 0.3)  # Medium relevance for French society (+2)
+    if f[F_RELEVANT_CATEGORY] != 0:                      # Category-based relevance (+1)
+        relevance += 1.0
+    relevance -= min(3.0, f[F_LOW_RELEVANCE] * 1.0)     # Penalties for low relevance (-3)
+    if f[F_INTERNATIONAL] != 0:                          # International news penalty (-1)
+        relevance -= 1.0
+    
+    # Importance (0-10)
+    importance = 4.0  # Base score
+    if f[F_HIGH_IMPORTANCE] != 0:   # Breaking news/urgent (+2)
+        importance += 2.0
+    if f[F_POLICY] != 0:            # Government/policy news (+2)
+        importance += 2.0
+    if f[F_ECONOMIC] != 0:          # Economic impact (+1.5)
+        importance += 1.5
+    if f[F_SOCIAL] != 0:            # Social impact (+1.5)
+        importance += 1.5
+    if f[F_REPUTABLE_SOURCE] != 0:  # Source reputation (+1)
+        importance += 1.0
+    if f[F_LOCAL] != 0:             # Local/regional penalty (unless major city) (-1)
+        importance -= 1.0
+    
+    return (max(0.0, min(10.0, quality)),
+            max(0.0, min(10.0, relevance)),
+            max(0.0, min(10.0, importance)))
+
+if _NUMBA_AVAILABLE:
+    _score_features_jit = njit(cache=True)(score_features)
+
+    @njit(cache=True, parallel=True)
+    def _score_batch_jit(features):
+        """Score every row of an (N, N_FEATURES) float64 array into an (N, 3) array"""
+        scores = np.empty((features.shape[0], 3))
+        for i in prange(features.shape[0]):
+            quality, relevance, importance = _score_features_jit(features[i])
+            scores[i, 0] = quality
+            scores[i, 1] = relevance
+            scores[i, 2] = importance
+        return scores
+
+def score_batch(features: Sequence[Sequence[float]]) -> Sequence[Tuple[float, float, float]]:
+    """(quality, relevance, importance) for each feature row"""
+    if _NUMBA_AVAILABLE and len(features):
+        return [tuple(row) for row in _score_batch_jit(np.asarray(features, dtype=np.float64)).tolist()]
+    return [score_features(row) for row in features]
+
+def warm_up():
+    """Trigger JIT compilation up front so the first real call doesn't pay for it"""
+    if _NUMBA_AVAILABLE:
+        score_batch([[0.0] * N_FEATURES])
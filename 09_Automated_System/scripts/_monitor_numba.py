@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Better French Max - Monitoring Aggregates
+JIT-compiled summaries of the monitor's resource samples and curated article scores
+"""
+
+from typing import Sequence, Tuple
+
+try:
+    import numpy as np
+    from numba import njit  # Optional: native sample/score aggregation
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    njit = None
+    _NUMBA_AVAILABLE = False
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _sample_stats_jit(samples):
+        """Mean, p95 and max of a non-empty float64 array"""
+        ordered = np.sort(samples)
+        n = ordered.shape[0]
+        return ordered.sum() / n, ordered[int(0.95 * (n - 1))], ordered[n - 1]
+
+    @njit(cache=True)
+    def _score_stats_jit(scores, threshold):
+        """Sum, min, max and below-threshold count of a non-empty float64 array in one pass"""
+        total = 0.0
+        lowest = scores[0]
+        highest = scores[0]
+        below = 0
+        for score in scores:
+            total += score
+            if score < lowest:
+                lowest = score
+            elif score > highest:
+                highest = score
+            if score < threshold:
+                below += 1
+        return total, lowest, highest, below
+
+def _sample_stats_py(samples: Sequence[float]) -> Tuple[float, float, float]:
+    """Pure-Python fallback for sample_stats"""
+    ordered = sorted(samples)
+    n = len(ordered)
+    return sum(ordered) / n, ordered[int(0.95 * (n - 1))], ordered[-1]
+
+def _score_stats_py(scores: Sequence[float], threshold: float) -> Tuple[float, float, float, int]:
+    """Pure-Python fallback for score_stats"""
+    total = 0
+    below = 0
+    lowest = highest = scores[0]
+    for score in scores:
+        total += score
+        if score < lowest:
+            lowest = score
+        elif score > highest:
+            highest = score
+        if score < threshold:
+            below += 1
+    return total, lowest, highest, below
+
+def sample_stats(samples: Sequence[float]) -> Tuple[float, float, float]:
+    """(mean, p95, max) of a non-empty sequence of resource samples"""
+    if _NUMBA_AVAILABLE:
+        mean, p95, peak = _sample_stats_jit(np.asarray(samples, dtype=np.float64))
+        return float(mean), float(p95), float(peak)
+    return _sample_stats_py(samples)
+
+def score_stats(scores: Sequence[float], threshold: float) -> Tuple[float, float, float, int]:
+    """(sum, min, max, count below threshold) of a non-empty sequence of article scores"""
+    if _NUMBA_AVAILABLE:
+        total, lowest, highest, below = _score_stats_jit(np.asarray(scores, dtype=np.float64), float(threshold))
+        return float(total), float(lowest), float(highest), int(below)
+    return _score_stats_py(scores, threshold)
+
+def warm_up():
+    """Trigger JIT compilation up front so the first real call doesn't pay for it"""
+    if _NUMBA_AVAILABLE:
+        sample_stats([0.0])
+        score_stats([0.0], 0.0)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Better French Max - SimHash Accumulator
+JIT-compiled 64-lane SimHash counter used by the scraper's near-duplicate filter
+"""
+
+from typing import Iterable
+
+try:
+    import numpy as np
+    from numba import njit  # Optional: native SimHash accumulation
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    np = None
+    njit = None
+    _NUMBA_AVAILABLE = False
+
+if _NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _simhash_accum_jit(token_hashes):
+        """Accumulate per-bit votes over uint64 token hashes and pack the signs"""
+        counter = np.zeros(64, dtype=np.int64)
+        one = np.uint64(1)
+        for h in token_hashes:
+            for b in range(64):
+                if (h >> np.uint64(b)) & one:
+                    counter[b] += 1
+                else:
+                    counter[b] -= 1
+
+        fingerprint = np.uint64(0)
+        for b in range(64):
+            if counter[b] > 0:
+                fingerprint |= one << np.uint64(b)
+        return fingerprint
+
+def _simhash_accum_py(token_hashes: Iterable[int]) -> int:
+    """Pure-Python fallback for the SimHash accumulator"""
+    counters = [0] * 64
+    for h in token_hashes:
+        for bit in range(64):
+            counters[bit] += 1 if (h >> bit) & 1 else -1
+
+    fingerprint = 0
+    for bit, count in enumerate(counters):
+        if count > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+def simhash_accum(token_hashes: Iterable[int]) -> int:
+    """Fold 64-bit token hashes into a SimHash fingerprint"""
+    if _NUMBA_AVAILABLE:
+        return int(_simhash_accum_jit(np.fromiter(token_hashes, dtype=np.uint64)))
+    return _simhash_accum_py(token_hashes)
+
+def warm_up():
+    """Trigger JIT compilation up front so the first real call doesn't pay for it"""
+    if _NUMBA_AVAILABLE:
+        simhash_accum([1])
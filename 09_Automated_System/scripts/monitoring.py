@@ -7,33 +7,143 @@ Tracks health, performance, quality metrics, and costs
 
 import os
 import sys
+import asyncio
+import gzip
 import json
+import queue
+import signal
 import time
-import psutil
+from psutil import Process, cpu_percent, disk_usage, virtual_memory
 import logging
+from collections import deque
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Any, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from pathlib import Path
 import threading
 
+try:
+    import orjson  # Optional: fast parsing of data files and encoding of metrics
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # Optional: read website_data.json's metadata without parsing the articles
+except ImportError:
+    ijson = None
+
 # Add config directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
-from automation import AUTOMATION_CONFIG
+from automation import AUTOMATION_CONFIG, DATA_FRESHNESS_MAX_AGE_SEC, HEALTH_CHECK_INTERVAL_SEC
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from _monitor_numba import sample_stats, score_stats, warm_up
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+if orjson is not None:
+    _loads = orjson.loads
+    _dumps_bytes = orjson.dumps
+else:
+    _loads = json.loads
+    
+    def _dumps_bytes(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+def disk_root_usage() -> Tuple[int, int, float]:
+    """(total bytes, free bytes, percent used) of the root filesystem. On POSIX this is one
+    statvfs call with psutil's definitions (free/percent as seen by unprivileged users)"""
+    if os.name != 'posix':
+        usage = disk_usage('/')
+        return usage.total, usage.free, usage.percent
+    
+    st = os.statvfs('/')
+    total = st.f_blocks * st.f_frsize
+    free = st.f_bavail * st.f_frsize
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    available_total = used + free
+    percent = round(used / available_total * 100, 1) if available_total else 0.0
+    return total, free, percent
+
+def _read_json(path: str) -> Any:
+    """Parse a JSON file from its raw bytes"""
+    with open(path, 'rb') as f:
+        return _loads(f.read())
+
+def _read_json_metadata(path: str) -> Dict[str, Any]:
+    """The top-level "metadata" object of a data file. The writers put it first, so with ijson
+    only the file's head is read and parsed, not the article list after it"""
+    if ijson is None:
+        return _read_json(path).get('metadata', {})
+    
+    with open(path, 'rb') as f:
+        for metadata in ijson.items(f, 'metadata', use_float=True):
+            return metadata
+    return {}
+
+# Health report layout; the optional sections are rendered separately and dropped in whole
+HEALTH_REPORT_TEMPLATE = """🔍 Better French Max - System Health Report
+==================================================
+📅 Generated: {generated}
+⚡ Status: {status}
+
+{system_block}{quality_block}{issues_block}"""
+
+SYSTEM_BLOCK_TEMPLATE = """💻 System Resources:
+   CPU Usage: {cpu:.1f}%
+   Memory Usage: {memory:.1f}%
+   Disk Usage: {disk:.1f}%
+   Uptime: {uptime:.1f} hours
+
+"""
+
+QUALITY_BLOCK_TEMPLATE = """🎯 Quality Metrics:
+   Articles Today: {articles}
+   Average Score: {average:.1f}/30
+   Quality Threshold: {threshold}/30
+
+"""
+
 class SystemMonitor:
     """
     Enterprise-grade system monitoring for Better French Max automation
     Tracks performance, quality, costs, and system health
     """
     
+    # Seconds a check result is reused, so a report/diagnosis (or a scraper polling us) that asks
+    # for the same check several times in a row only pays for it once
+    CACHE_TTL = 1.0
+    DISK_USAGE_TTL = 30.0  # free space barely moves between polls, and statvfs can stall on a busy FS
+    
+    # Components whose script file must be present in scripts/
+    COMPONENTS = ('smart_scraper', 'quality_curator', 'website_updater', 'ai_processor')
+    # script file name -> its component's bit in the presence mask
+    _COMPONENT_BITS = {f"{component}.py": 1 << i for i, component in enumerate(COMPONENTS)}
+    _ALL_COMPONENTS_MASK = (1 << len(COMPONENTS)) - 1
+    
     def __init__(self):
         self.monitoring_config = AUTOMATION_CONFIG['monitoring']
         self.reliability_config = AUTOMATION_CONFIG['reliability']
         self.cost_config = AUTOMATION_CONFIG['cost']
         
+        # Thresholds read on every check, looked up once here
+        self.min_total_score = AUTOMATION_CONFIG['quality']['min_total_score']
+        self.max_age_hours = self.reliability_config['max_article_age_hours']
+        self.memory_usage_limit = self.reliability_config['memory_usage_limit']
+        self.health_check_interval = self.reliability_config['health_check_interval']
+        self.daily_cost_limit = self.cost_config['daily_cost_limit']
+        self.cost_alert_threshold = self.cost_config['cost_alert_threshold']
+        
+        # Static part of every metrics snapshot
+        self._monitoring_summary = {
+            'health_check_interval': self.health_check_interval,
+            'quality_threshold': self.min_total_score,
+            'cost_limits': {
+                'daily_limit': self.daily_cost_limit,
+                'alert_threshold': self.cost_alert_threshold
+            }
+        }
+        
         # Monitoring state
         self.metrics = {
             'system_health': {},
@@ -46,7 +156,9 @@ class SystemMonitor:
         # Paths
         self.logs_dir = os.path.join(os.path.dirname(__file__), '..', 'logs')
         self.data_dir = os.path.join(os.path.dirname(__file__), '..', 'data', 'live')
-        self.metrics_file = os.path.join(self.logs_dir, 'metrics.json')
+        self.metrics_file = os.path.join(self.logs_dir, self.monitoring_config['metrics_file'])
+        self.website_data_file = os.path.join(self.data_dir, 'website_data.json')
+        self._curated_prefix = os.path.join(self.data_dir, 'curated_articles_')
         
         # Ensure directories exist
         os.makedirs(self.logs_dir, exist_ok=True)
@@ -55,17 +167,136 @@ class SystemMonitor:
         # Start time for uptime tracking
         self.start_time = datetime.now(timezone.utc)
         
-        # Threading for background monitoring
-        self.monitoring_active = False
+        # Threading for background monitoring (set _stop to wake the loop and end it immediately)
+        self._stop = threading.Event()
         self.monitor_thread = None
         
+        # While background monitoring runs, encoded metrics go through this queue to a writer thread
+        # so disk latency never stalls a health cycle (None tells the writer to finish)
+        self._write_queue: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=4)
+        self._writer_thread = None
+        
+        # Prime psutil's CPU counter: later cpu_percent(interval=None) calls return the usage
+        # since the previous call (i.e. over one monitoring interval) without blocking
+        cpu_percent(interval=None)
+        self._proc = Process()
+        
+        # While background monitoring runs, a sampler thread appends CPU/memory readings every
+        # resource_sample_interval_sec and health checks use the window's average rather than a
+        # single point reading (one writer thread, deque appends are atomic - no lock needed)
+        self.sample_interval = self.monitoring_config['resource_sample_interval_sec']
+        self._cpu_samples: "deque[float]" = deque(maxlen=self.monitoring_config['resource_sample_window'])
+        self._memory_samples: "deque[float]" = deque(maxlen=self.monitoring_config['resource_sample_window'])
+        self._sampler_thread = None
+        
+        # check name -> (monotonic time computed, result)
+        self._cache: Dict[str, Tuple[float, Any]] = {}
+        
+        # (scripts dir mtime_ns, component health) - rescanned only when files are added/removed
+        self.scripts_dir = os.path.dirname(os.path.abspath(__file__))
+        self._component_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        
+        # slot -> (path, st_mtime_ns, st_size, parsed JSON) for data files we re-read every cycle
+        # (one entry per slot, so yesterday's curated file is dropped once today's is read)
+        self._json_cache: Dict[str, Tuple[str, int, int, Any]] = {}
+        
         logger.info("📊 System Monitor initialized")
-        logger.info(f"🔍 Health check interval: {self.reliability_config['health_check_interval']} minutes")
+        logger.info(f"🔍 Health check interval: {self.health_check_interval} minutes")
+    
+    def _cached(self, key: str, ttl: float, compute: Callable[[], Any], use_cache: bool = True) -> Any:
+        """Return compute()'s result, reusing the last one if it is younger than ttl seconds"""
+        now = time.monotonic()
+        if use_cache:
+            hit = self._cache.get(key)
+            if hit and now - hit[0] < ttl:
+                return hit[1]
+        
+        result = compute()
+        self._cache[key] = (now, result)
+        return result
+    
+    def _load_json_cached(self, slot: str, path: str, prepare: Optional[Callable[[Any], Any]] = None,
+                          reader: Callable[[str], Any] = _read_json) -> Any:
+        """Parse a JSON data file with reader() (optionally reduced by prepare()), reusing the last
+        result while the file's path, mtime and size are unchanged"""
+        st = os.stat(path)
+        key = (path, st.st_mtime_ns, st.st_size)
+        hit = self._json_cache.get(slot)
+        if hit and hit[:3] == key:
+            return hit[3]
+        
+        data = reader(path)
+        if prepare is not None:
+            data = prepare(data)
+        self._json_cache[slot] = (*key, data)
+        return data
+    
+    @staticmethod
+    def _website_update_info(metadata: Dict[str, Any]) -> Dict[str, Any]:
+        """The bits of website_data.json the freshness check needs, with updated_at parsed once per file change"""
+        last_update = metadata.get('updated_at')
+        return {
+            'last_update': last_update,
+            'update_ts': datetime.fromisoformat(last_update.replace('Z', '+00:00')).timestamp() if last_update else None,
+            'article_count': metadata.get('total_articles', 0)
+        }
+    
+    def _curated_file(self, now: datetime) -> str:
+        """Path of the curated articles file for now's (UTC) date"""
+        return f"{self._curated_prefix}{now.date().isoformat()}.json"
+    
+    def _cpu_percent(self) -> float:
+        """CPU usage since the previous reading; reused within a cycle so a second reader
+        doesn't get the near-empty window right after the first"""
+        return self._cached('cpu_percent', self.CACHE_TTL, lambda: cpu_percent(interval=None))
+    
+    def _virtual_memory(self):
+        """psutil.virtual_memory(), shared by the health check and performance metrics of one cycle"""
+        return self._cached('virtual_memory', self.CACHE_TTL, virtual_memory)
     
-    def check_system_health(self) -> Dict[str, Any]:
-        """Comprehensive system health check"""
+    def _disk_usage(self) -> Tuple[int, int, float]:
+        """disk_root_usage(), refreshed at most every DISK_USAGE_TTL seconds"""
+        return self._cached('disk_usage', self.DISK_USAGE_TTL, disk_root_usage)
+    
+    def _resource_stats(self) -> Optional[Dict[str, float]]:
+        """Mean/p95/max of the sampled CPU and memory usage, or None if the sampler isn't running"""
+        if self._sampler_thread is None:
+            return None
+        cpu = list(self._cpu_samples)
+        memory = list(self._memory_samples)
+        if not cpu or not memory:
+            return None
+        
+        cpu_mean, cpu_p95, cpu_max = sample_stats(cpu)
+        memory_mean, memory_p95, memory_max = sample_stats(memory)
+        return {
+            'cpu_mean': cpu_mean,
+            'cpu_p95': cpu_p95,
+            'cpu_max': cpu_max,
+            'memory_mean': memory_mean,
+            'memory_p95': memory_p95,
+            'memory_max': memory_max,
+            'samples': min(len(cpu), len(memory))
+        }
+    
+    def _sampler_loop(self):
+        """Record CPU/memory usage every sample_interval seconds until monitoring stops"""
+        warm_up()  # compile the aggregates here rather than in the first health check
+        while True:
+            self._cpu_samples.append(cpu_percent(interval=None))
+            self._memory_samples.append(virtual_memory().percent)
+            if self._stop.wait(self.sample_interval):
+                return
+    
+    def check_system_health(self, use_cache: bool = True) -> Dict[str, Any]:
+        """Comprehensive system health check (reused for CACHE_TTL seconds unless use_cache=False)"""
+        return self._cached('system_health', self.CACHE_TTL, self._run_health_check, use_cache)
+    
+    def _run_health_check(self) -> Dict[str, Any]:
+        """Run every health check and combine them into one status"""
+        now = datetime.now(timezone.utc)
         health_status = {
-            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'timestamp': now.isoformat(),
             'status': 'healthy',
             'issues': [],
             'metrics': {}
@@ -73,28 +304,36 @@ class SystemMonitor:
         
         try:
             # 1. System Resource Health
-            cpu_percent = psutil.cpu_percent(interval=1)
-            memory = psutil.virtual_memory()
-            disk = psutil.disk_usage('/')
+            disk_percent = self._disk_usage()[2]
+            resources = self._resource_stats()
+            if resources is not None:
+                # Averaged over the sample window, so a momentary spike doesn't flip the status
+                cpu_percent = resources['cpu_mean']
+                memory_percent = resources['memory_mean']
+            else:
+                cpu_percent = self._cpu_percent()
+                memory_percent = self._virtual_memory().percent
             
             health_status['metrics']['system'] = {
                 'cpu_percent': cpu_percent,
-                'memory_percent': memory.percent,
-                'disk_percent': disk.percent,
-                'uptime_hours': (datetime.now(timezone.utc) - self.start_time).total_seconds() / 3600
+                'memory_percent': memory_percent,
+                'disk_percent': disk_percent,
+                'uptime_hours': (now - self.start_time).total_seconds() / 3600
             }
+            if resources is not None:
+                health_status['metrics']['system']['sampled'] = resources
             
             # Check system resource alerts
-            if memory.percent > self.reliability_config['memory_usage_limit']:
-                health_status['issues'].append(f"High memory usage: {memory.percent:.1f}%")
+            if memory_percent > self.memory_usage_limit:
+                health_status['issues'].append(f"High memory usage: {memory_percent:.1f}%")
                 health_status['status'] = 'warning'
             
             if cpu_percent > 90:
                 health_status['issues'].append(f"High CPU usage: {cpu_percent:.1f}%")
                 health_status['status'] = 'warning'
             
-            if disk.percent > 90:
-                health_status['issues'].append(f"High disk usage: {disk.percent:.1f}%")
+            if disk_percent > 90:
+                health_status['issues'].append(f"High disk usage: {disk_percent:.1f}%")
                 health_status['status'] = 'warning'
             
             # 2. Component Health
@@ -145,57 +384,61 @@ class SystemMonitor:
     
     def _check_component_health(self) -> Dict[str, Any]:
         """Check health of individual components"""
-        components = {
-            'smart_scraper': False,
-            'quality_curator': False,
-            'website_updater': False,
-            'ai_processor': False
-        }
-        
         try:
-            # Check if component files exist and are recent
-            scripts_dir = os.path.dirname(__file__)
-            
-            for component in components:
-                component_file = os.path.join(scripts_dir, f"{component}.py")
-                if os.path.exists(component_file):
-                    components[component] = True
-            
-            return {
-                'components': components,
-                'all_operational': all(components.values()),
-                'operational_count': sum(components.values()),
-                'total_components': len(components)
-            }
+            # The directory's mtime changes whenever a file in it is created, removed or renamed,
+            # so one stat() tells us whether the last scan still holds
+            scripts_mtime = os.stat(self.scripts_dir).st_mtime_ns
+            if self._component_cache is None or self._component_cache[0] != scripts_mtime:
+                self._component_cache = (scripts_mtime, self._scan_component_health())
+            return self._component_cache[1]
             
         except Exception as e:
             logger.error(f"❌ Component health check failed: {e}")
             return {'error': str(e), 'all_operational': False}
     
+    def _scan_component_health(self) -> Dict[str, Any]:
+        """Look for each component's script file with a single directory read"""
+        bits = self._COMPONENT_BITS
+        mask = 0
+        with os.scandir(self.scripts_dir) as entries:
+            for entry in entries:
+                bit = bits.get(entry.name)
+                if bit and entry.is_file():
+                    mask |= bit
+        
+        return {
+            'components': {component: bool(mask & (1 << i)) for i, component in enumerate(self.COMPONENTS)},
+            'all_operational': mask == self._ALL_COMPONENTS_MASK,
+            'operational_count': bin(mask).count('1'),
+            'total_components': len(self.COMPONENTS)
+        }
+    
     def _check_data_freshness(self) -> Dict[str, Any]:
         """Check if data is fresh and up-to-date"""
+        return self._cached('data_freshness', self.CACHE_TTL, self._read_data_freshness)
+    
+    def _read_data_freshness(self) -> Dict[str, Any]:
+        """Read the website data's last update time"""
         try:
             # Check latest website data
-            website_data_file = os.path.join(self.data_dir, 'website_data.json')
-            
-            if os.path.exists(website_data_file):
-                with open(website_data_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+            if os.path.exists(self.website_data_file):
+                info = self._load_json_cached('website', self.website_data_file, self._website_update_info,
+                                              reader=_read_json_metadata)
                 
-                last_update = data.get('metadata', {}).get('updated_at')
+                last_update = info['last_update']
                 if last_update:
-                    update_time = datetime.fromisoformat(last_update.replace('Z', '+00:00'))
-                    hours_since_update = (datetime.now(timezone.utc) - update_time).total_seconds() / 3600
+                    seconds_since_update = time.time() - info['update_ts']
+                    hours_since_update = seconds_since_update / 3600
                     
-                    max_age = self.reliability_config['max_article_age_hours']
-                    data_fresh = hours_since_update < max_age
+                    max_age = self.max_age_hours
+                    data_fresh = seconds_since_update < DATA_FRESHNESS_MAX_AGE_SEC
                     
                     return {
                         'data_fresh': data_fresh,
                         'hours_since_update': hours_since_update,
                         'max_age_hours': max_age,
                         'last_update': last_update,
-                        'article_count': data.get('metadata', {}).get('total_articles', 0)
+                        'article_count': info['article_count']
                     }
             
             return {
@@ -210,38 +453,34 @@ class SystemMonitor:
     
     def _check_quality_trends(self) -> Dict[str, Any]:
         """Check for quality decline trends"""
+        return self._cached('quality_trends', self.CACHE_TTL, self._read_quality_trends)
+    
+    def _read_quality_trends(self) -> Dict[str, Any]:
+        """Score statistics of today's curated articles"""
         try:
-            # Look for recent curated articles to analyze quality trends
-            quality_scores = []
-            
             # Check today's curated articles
-            today = datetime.now(timezone.utc).date().isoformat()
-            curated_file = os.path.join(self.data_dir, f"curated_articles_{today}.json")
+            curated_file = self._curated_file(datetime.now(timezone.utc))
             
+            articles = []
             if os.path.exists(curated_file):
-                with open(curated_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
+                data = self._load_json_cached('curated', curated_file)
                 articles = data.get('articles', [])
-                if articles:
-                    quality_scores = [a.get('total_score', 0) for a in articles]
             
-            if quality_scores:
-                avg_quality = sum(quality_scores) / len(quality_scores)
-                min_quality = min(quality_scores)
-                max_quality = max(quality_scores)
-                
+            if articles:
                 # Simple quality decline detection
-                threshold = AUTOMATION_CONFIG['quality']['min_total_score']
-                below_threshold = len([s for s in quality_scores if s < threshold])
+                threshold = self.min_total_score
+                
+                # One pass for sum/min/max/below-threshold instead of four
+                scores = [article.get('total_score', 0) for article in articles]
+                total, min_quality, max_quality, below_threshold = score_stats(scores, threshold)
                 
                 return {
-                    'average_quality': avg_quality,
+                    'average_quality': total / len(articles),
                     'min_quality': min_quality,
                     'max_quality': max_quality,
-                    'total_articles': len(quality_scores),
+                    'total_articles': len(articles),
                     'below_threshold': below_threshold,
-                    'declining_quality': below_threshold > len(quality_scores) * 0.3,  # 30% threshold
+                    'declining_quality': below_threshold > len(articles) * 0.3,  # 30% threshold
                     'quality_threshold': threshold
                 }
             
@@ -257,12 +496,16 @@ class SystemMonitor:
     
     def _check_cost_status(self) -> Dict[str, Any]:
         """Check current cost status and alerts"""
+        return self._cached('cost_status', self.CACHE_TTL, self._read_cost_status)
+    
+    def _read_cost_status(self) -> Dict[str, Any]:
+        """Compare today's cost against the configured limits"""
         try:
             # This would integrate with actual cost tracking
             # For now, simulate cost monitoring based on config limits
             
-            daily_limit = self.cost_config['daily_cost_limit']
-            alert_threshold = self.cost_config['cost_alert_threshold']
+            daily_limit = self.daily_cost_limit
+            alert_threshold = self.cost_alert_threshold
             
             # Placeholder for actual cost tracking
             estimated_daily_cost = 0.0  # Would be calculated from actual usage
@@ -280,61 +523,83 @@ class SystemMonitor:
             logger.error(f"❌ Cost status check failed: {e}")
             return {'error': str(e), 'cost_alert': False}
     
-    def get_performance_metrics(self) -> Dict[str, Any]:
-        """Get detailed performance metrics"""
+    def get_system_section(self) -> Dict[str, Any]:
+        """Host CPU, memory and disk usage"""
+        memory = self._virtual_memory()
+        disk_total, disk_free, disk_percent = self._disk_usage()
+        return {
+            'cpu_percent': self._cpu_percent(),
+            'memory': {
+                'total_gb': memory.total / (1024**3),
+                'available_gb': memory.available / (1024**3),
+                'percent_used': memory.percent
+            },
+            'disk': {
+                'total_gb': disk_total / (1024**3),
+                'free_gb': disk_free / (1024**3),
+                'percent_used': disk_percent
+            }
+        }
+    
+    def get_process_section(self) -> Dict[str, Any]:
+        """This process's pid, thread count and resident memory"""
+        with self._proc.oneshot():
+            process_memory_mb = self._proc.memory_info().rss / (1024**2)
+        return {
+            'pid': os.getpid(),
+            'threads': threading.active_count(),
+            'memory_mb': process_memory_mb
+        }
+    
+    def get_performance_metrics(self, include_process: bool = True) -> Dict[str, Any]:
+        """Get detailed performance metrics (the 'process' section is skipped when include_process=False;
+        with it, the layout is the one written to metrics.json)"""
         try:
-            return {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+            # One clock reading so the timestamp and both uptime figures agree
+            now = datetime.now(timezone.utc)
+            uptime = now - self.start_time
+            
+            metrics = {
+                'timestamp': now.isoformat(),
                 'uptime': {
                     'start_time': self.start_time.isoformat(),
-                    'uptime_hours': (datetime.now(timezone.utc) - self.start_time).total_seconds() / 3600,
-                    'uptime_days': (datetime.now(timezone.utc) - self.start_time).days
+                    'uptime_hours': uptime.total_seconds() / 3600,
+                    'uptime_days': uptime.days
                 },
-                'system': {
-                    'cpu_percent': psutil.cpu_percent(),
-                    'memory': {
-                        'total_gb': psutil.virtual_memory().total / (1024**3),
-                        'available_gb': psutil.virtual_memory().available / (1024**3),
-                        'percent_used': psutil.virtual_memory().percent
-                    },
-                    'disk': {
-                        'total_gb': psutil.disk_usage('/').total / (1024**3),
-                        'free_gb': psutil.disk_usage('/').free / (1024**3),
-                        'percent_used': psutil.disk_usage('/').percent
-                    }
-                },
-                'process': {
-                    'pid': os.getpid(),
-                    'threads': threading.active_count(),
-                    'memory_mb': psutil.Process().memory_info().rss / (1024**2)
-                }
+                'system': self.get_system_section()
             }
+            if include_process:
+                metrics['process'] = self.get_process_section()
+            return metrics
             
         except Exception as e:
             logger.error(f"❌ Performance metrics collection failed: {e}")
             return {'error': str(e)}
     
-    def get_quality_summary(self) -> Dict[str, Any]:
-        """Get quality metrics summary for dashboard"""
+    def get_quality_summary(self, use_cache: bool = True) -> Dict[str, Any]:
+        """Get quality metrics summary for dashboard (reused for CACHE_TTL seconds unless use_cache=False)"""
+        return self._cached('quality_summary', self.CACHE_TTL, self._read_quality_summary, use_cache)
+    
+    def _read_quality_summary(self) -> Dict[str, Any]:
+        """Summarize today's curated articles file"""
         try:
             # Load latest quality data
-            today = datetime.now(timezone.utc).date().isoformat()
-            curated_file = os.path.join(self.data_dir, f"curated_articles_{today}.json")
+            now = datetime.now(timezone.utc)
+            curated_file = self._curated_file(now)
             
             if os.path.exists(curated_file):
-                with open(curated_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                data = self._load_json_cached('curated', curated_file)
                 
                 return {
-                    'timestamp': datetime.now(timezone.utc).isoformat(),
+                    'timestamp': now.isoformat(),
                     'total_articles': data.get('count', 0),
                     'quality_stats': data.get('metadata', {}).get('statistics', {}),
-                    'threshold': AUTOMATION_CONFIG['quality']['min_total_score'],
+                    'threshold': self.min_total_score,
                     'status': 'active'
                 }
             
             return {
-                'timestamp': datetime.now(timezone.utc).isoformat(),
+                'timestamp': now.isoformat(),
                 'status': 'no_data',
                 'message': 'No recent quality data available'
             }
@@ -351,101 +616,177 @@ class SystemMonitor:
                 'system_health': self.metrics.get('system_health', {}),
                 'performance': self.get_performance_metrics(),
                 'quality': self.get_quality_summary(),
-                'monitoring_config': {
-                    'health_check_interval': self.reliability_config['health_check_interval'],
-                    'quality_threshold': AUTOMATION_CONFIG['quality']['min_total_score'],
-                    'cost_limits': {
-                        'daily_limit': self.cost_config['daily_cost_limit'],
-                        'alert_threshold': self.cost_config['cost_alert_threshold']
-                    }
-                }
+                'monitoring_config': self._monitoring_summary
             }
             
-            with open(self.metrics_file, 'w', encoding='utf-8') as f:
-                json.dump(metrics_data, f, ensure_ascii=False, indent=2)
+            payload = _dumps_bytes(metrics_data)
+            if self._writer_thread is not None and self._writer_thread.is_alive():
+                self._enqueue_metrics(payload)
+            else:
+                self._write_metrics_file(payload)
+            
+        except Exception as e:
+            logger.error(f"❌ Failed to save metrics: {e}")
+    
+    def _enqueue_metrics(self, payload: bytes):
+        """Hand a payload to the writer thread, dropping the oldest pending one if it's behind"""
+        while True:
+            try:
+                self._write_queue.put_nowait(payload)
+                return
+            except queue.Full:
+                try:
+                    self._write_queue.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def _write_metrics_file(self, payload: bytes):
+        """Write encoded metrics through a 64 KiB buffer (gzip level 1 for *.gz), to a temp file
+        swapped in so a killed daemon never leaves a half-written metrics file"""
+        try:
+            tmp_file = f"{self.metrics_file}.tmp"
+            if self.metrics_file.endswith('.gz'):
+                f = gzip.open(tmp_file, 'wb', compresslevel=1)
+            else:
+                f = open(tmp_file, 'wb', buffering=64 * 1024)
+            with f:
+                f.write(payload)
+            os.replace(tmp_file, self.metrics_file)
             
             logger.debug(f"📊 Metrics saved to {self.metrics_file}")
             
         except Exception as e:
             logger.error(f"❌ Failed to save metrics: {e}")
     
-    def generate_health_report(self) -> str:
-        """Generate human-readable health report"""
+    def _metrics_writer_loop(self):
+        """Write queued metrics; metrics.json is overwritten each time, so only the newest pending payload is written"""
+        while True:
+            payload = self._write_queue.get()
+            finished = payload is None
+            while True:
+                try:
+                    queued = self._write_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if queued is None:
+                    finished = True
+                else:
+                    payload = queued
+            
+            if payload is not None:
+                self._write_metrics_file(payload)
+            if finished:
+                return
+    
+    def _health_report_context(self) -> Dict[str, str]:
+        """Flatten health, performance and quality into the fields of HEALTH_REPORT_TEMPLATE"""
         health = self.check_system_health()
-        performance = self.get_performance_metrics()
+        performance = self.get_performance_metrics(include_process=False)  # the report doesn't show it
         quality = self.get_quality_summary()
         
-        report_lines = [
-            "🔍 Better French Max - System Health Report",
-            "=" * 50,
-            f"📅 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
-            f"⚡ Status: {health['status'].upper()}",
-            ""
-        ]
+        ctx = {
+            'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'status': health['status'].upper(),
+            'system_block': '',
+            'quality_block': '',
+        }
         
         # System metrics
         if 'system' in performance:
             sys_metrics = performance['system']
-            report_lines.extend([
-                "💻 System Resources:",
-                f"   CPU Usage: {sys_metrics.get('cpu_percent', 0):.1f}%",
-                f"   Memory Usage: {sys_metrics.get('memory', {}).get('percent_used', 0):.1f}%",
-                f"   Disk Usage: {sys_metrics.get('disk', {}).get('percent_used', 0):.1f}%",
-                f"   Uptime: {performance.get('uptime', {}).get('uptime_hours', 0):.1f} hours",
-                ""
-            ])
+            ctx['system_block'] = SYSTEM_BLOCK_TEMPLATE.format(
+                cpu=sys_metrics.get('cpu_percent', 0),
+                memory=sys_metrics.get('memory', {}).get('percent_used', 0),
+                disk=sys_metrics.get('disk', {}).get('percent_used', 0),
+                uptime=performance.get('uptime', {}).get('uptime_hours', 0)
+            )
         
         # Quality metrics
         if quality.get('status') == 'active':
             stats = quality.get('quality_stats', {})
             if stats and 'total' in stats:
-                report_lines.extend([
-                    "🎯 Quality Metrics:",
-                    f"   Articles Today: {quality.get('total_articles', 0)}",
-                    f"   Average Score: {stats['total'].get('avg', 0):.1f}/30",
-                    f"   Quality Threshold: {quality.get('threshold', 0)}/30",
-                    ""
-                ])
+                ctx['quality_block'] = QUALITY_BLOCK_TEMPLATE.format(
+                    articles=quality.get('total_articles', 0),
+                    average=stats['total'].get('avg', 0),
+                    threshold=quality.get('threshold', 0)
+                )
         
         # Issues
         if health['issues']:
-            report_lines.extend([
-                "⚠️ Issues Detected:",
-                *[f"   • {issue}" for issue in health['issues']],
-                ""
-            ])
+            ctx['issues_block'] = "⚠️ Issues Detected:\n" + "".join(f"   • {issue}\n" for issue in health['issues'])
         else:
-            report_lines.append("✅ No issues detected")
+            ctx['issues_block'] = "✅ No issues detected"
         
-        return "\n".join(report_lines)
+        return ctx
+    
+    def generate_health_report(self) -> str:
+        """Generate human-readable health report (re-rendered at most once per CACHE_TTL seconds)"""
+        return self._cached('health_report', self.CACHE_TTL,
+                            lambda: HEALTH_REPORT_TEMPLATE.format(**self._health_report_context()))
+    
+    def write_health_report(self, report_file: str):
+        """Write the health report to a file"""
+        with open(report_file, 'w', encoding='utf-8') as f:
+            f.write(self.generate_health_report())
+            f.write('\n')
     
     def start_background_monitoring(self):
         """Start background monitoring thread"""
-        if not self.monitoring_active:
-            self.monitoring_active = True
+        if self.monitor_thread is None or not self.monitor_thread.is_alive():
+            self._stop.clear()
+            self._cpu_samples.clear()
+            self._memory_samples.clear()
+            self._sampler_thread = threading.Thread(target=self._sampler_loop, daemon=True)
+            self._sampler_thread.start()
+            self._writer_thread = threading.Thread(target=self._metrics_writer_loop, daemon=True)
+            self._writer_thread.start()
             self.monitor_thread = threading.Thread(target=self._monitoring_loop, daemon=True)
             self.monitor_thread.start()
             logger.info("🔄 Background monitoring started")
     
     def stop_background_monitoring(self):
         """Stop background monitoring"""
-        self.monitoring_active = False
+        self._stop.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
+            self.monitor_thread = None
+        if self._sampler_thread:
+            self._sampler_thread.join(timeout=5)
+            self._sampler_thread = None
+        if self._writer_thread:
+            # Flush whatever is still queued, then let the writer exit
+            self._write_queue.put(None)
+            self._writer_thread.join(timeout=5)
+            self._writer_thread = None
         logger.info("⏹️ Background monitoring stopped")
     
     def _monitoring_loop(self):
         """Background monitoring loop"""
-        interval = self.reliability_config['health_check_interval'] * 60  # Convert to seconds
+        interval = HEALTH_CHECK_INTERVAL_SEC
         
-        while self.monitoring_active:
+        while not self._stop.is_set():
             try:
                 self.check_system_health()
                 self.save_metrics()
-                time.sleep(interval)
+                self._stop.wait(interval)
+            except Exception as e:
+                logger.error(f"❌ Monitoring loop error: {e}")
+                self._stop.wait(60)  # Wait 1 minute before retrying
+    
+    async def run(self):
+        """Monitoring loop as an asyncio task, for callers that already run an event loop:
+        `task = loop.create_task(monitor.run())`, stopped with `task.cancel()`. The blocking
+        psutil/file work runs in the default executor so it never stalls the loop"""
+        interval = HEALTH_CHECK_INTERVAL_SEC
+        
+        while True:
+            try:
+                await asyncio.to_thread(self.check_system_health)
+                await asyncio.to_thread(self.save_metrics)
+                await asyncio.sleep(interval)
             except Exception as e:
                 logger.error(f"❌ Monitoring loop error: {e}")
-                time.sleep(60)  # Wait 1 minute before retrying
+                await asyncio.sleep(60)  # Wait 1 minute before retrying
 
 # CLI interface for standalone monitoring
 def main():
@@ -475,9 +816,10 @@ def main():
     
     elif args.diagnose:
         print("🔍 Running full system diagnostics...")
-        health = monitor.check_system_health()
+        # Force fresh readings; the report below then reuses them from the cache
+        health = monitor.check_system_health(use_cache=False)
         performance = monitor.get_performance_metrics()
-        quality = monitor.get_quality_summary()
+        quality = monitor.get_quality_summary(use_cache=False)
         
         print("\n" + monitor.generate_health_report())
         
@@ -488,13 +830,16 @@ def main():
     elif args.monitor:
         print("🔄 Starting continuous monitoring (Ctrl+C to stop)...")
         monitor.start_background_monitoring()
-        try:
-            while True:
-                time.sleep(30)
-                print(f"[{datetime.now().strftime('%H:%M:%S')}] Monitoring active...")
-        except KeyboardInterrupt:
-            print("\n⏹️ Stopping monitoring...")
-            monitor.stop_background_monitoring()
+        
+        # Ctrl+C / SIGTERM wake the wait below right away instead of after the current 30s nap
+        stop = threading.Event()
+        signal.signal(signal.SIGINT, lambda *_: stop.set())
+        signal.signal(signal.SIGTERM, lambda *_: stop.set())
+        while not stop.wait(30):
+            print(f"[{time.strftime('%H:%M:%S')}] Monitoring active...")
+        
+        print("\n⏹️ Stopping monitoring...")
+        monitor.stop_background_monitoring()
     
     else:
         parser.print_help()
@@ -12,18 +12,295 @@ import re
 import uuid
 import logging
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Tuple
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Optional, Tuple
+from dataclasses import dataclass, fields, is_dataclass
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+try:
+    import ahocorasick  # Optional: one-pass multi-keyword matching (pyahocorasick)
+except ImportError:
+    ahocorasick = None
+
+try:
+    from datasketch import MinHash, MinHashLSH  # Optional: LSH candidate pairs for duplicate detection
+except ImportError:
+    MinHash = MinHashLSH = None
+
+try:
+    from rapidfuzz.fuzz import ratio as fuzz_ratio  # Optional: C++ similarity ratio for title comparison
+except ImportError:
+    fuzz_ratio = None
+
+try:
+    import orjson  # Optional: fast pretty-printed output of the curated/rejected files
+except ImportError:
+    orjson = None
 
 # Add config directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
 from automation import AUTOMATION_CONFIG
 
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from _curator_numba import (
+    F_CAPS_TITLE, F_DESCRIPTIVE_TITLE, F_ECONOMIC, F_FRENCH_KINDS, F_FRENCH_PUNCT, F_HAS_AUTHOR,
+    F_HIGH_IMPORTANCE, F_HIGH_RELEVANCE, F_INTERNATIONAL, F_LOCAL, F_LONG_CONTENT, F_LONG_SUMMARY,
+    F_LOW_RELEVANCE, F_MEDIUM_RELEVANCE, F_POLICY, F_POOR_QUALITY, F_QUALITY_GROUPS, F_RELEVANT_CATEGORY,
+    F_REPUTABLE_SOURCE, F_SHORT_TEXT, F_SOCIAL, F_UNIQUE_SUMMARY, N_FEATURES, score_batch, score_features
+)
+
 # Set up logging
 logger = logging.getLogger(__name__)
 
-@dataclass
+if fuzz_ratio is not None:
+    def _similarity(text1: str, text2: str) -> float:
+        # Indel ratio: 2 * LCS / total length, never below difflib's block-matching ratio
+        return fuzz_ratio(text1, text2) / 100.0
+else:
+    def _similarity(text1: str, text2: str) -> float:
+        return SequenceMatcher(None, text1, text2).ratio()
+
+if orjson is not None:
+    def _dumps_pretty(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+else:
+    def _dumps_pretty(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, indent=2, default=_dataclass_dict).encode('utf-8')
+
+# Proper French structure markers (articles, common verbs, prepositions) as one alternation,
+# so score_quality() finds which kinds occur in a single scan of the text
+_FRENCH_COMBINED = re.compile(
+    r'(?P<art>\b(?:le|la|les|un|une|des)\b)'
+    r'|(?P<verb>\b(?:est|sont|était|sera)\b)'
+    r'|(?P<prep>\b(?:avec|dans|pour|sur|par)\b)'
+)
+_FRENCH_KINDS = 3
+
+# MinHash settings for duplicate candidates (character shingles of the lowercased title)
+_DUPLICATE_NUM_PERM = 128
+_DUPLICATE_SHINGLE_SIZE = 3
+
+# EXACT same keywords as proven manual system (frozen once at import, shared by every curator)
+HIGH_RELEVANCE_KEYWORDS = frozenset({
+    # Immigration & Legal
+    'immigration', 'visa', 'carte de séjour', 'naturalisation', 'préfecture', 
+    'titre de séjour', 'étranger', 'expatrié', 'résidence', 'citoyenneté',
+    
+    # Daily Life & Services
+    'sécurité sociale', 'caf', 'pôle emploi', 'impôts', 'logement', 'santé',
+    'transport', 'sncf', 'ratp', 'école', 'université', 'formation',
+    'banque', 'assurance', 'mutuelle', 'médecin', 'hôpital',
+    
+    # French Culture & Society
+    'culture française', 'tradition', 'laïcité', 'république', 'marianne',
+    'gastronomie', 'cuisine', 'vin', 'fromage', 'baguette', 'café',
+    'festival', 'patrimoine', 'monument', 'musée', 'art français',
+    
+    # Government & Politics (affecting daily life)
+    'gouvernement', 'président', 'assemblée nationale', 'sénat', 'maire',
+    'conseil municipal', 'région', 'département', 'commune', 'élection',
+    'réforme', 'loi', 'décret', 'politique sociale',
+    
+    # Economy & Work
+    'emploi', 'chômage', 'smic', 'salaire', 'retraite', 'cotisation',
+    'entreprise', 'startup', 'innovation', 'économie française', 'crise',
+    'inflation', 'pouvoir d\'achat', 'marché du travail',
+    
+    # Education & Language
+    'français langue étrangère', 'fle', 'apprentissage', 'intégration',
+    'cours de français', 'alliance française',
+    
+    # Regional Life
+    'paris', 'région parisienne', 'province', 'métropole', 'banlieue',
+    'quartier', 'arrondissement', 'ile-de-france'
+})
+
+MEDIUM_RELEVANCE_KEYWORDS = frozenset({
+    # National Events & News
+    'france', 'français', 'national', 'pays', 'état', 'société',
+    'population', 'citoyen', 'public', 'social', 'communauté',
+    
+    # Current Affairs
+    'actualité', 'information', 'débat', 'polémique', 'manifestation',
+    'grève', 'syndical', 'droit', 'justice', 'tribunal',
+    
+    # Technology & Innovation
+    'technologie', 'numérique', 'internet', 'intelligence artificielle',
+    'startup française', 'innovation française',
+    
+    # Environment (affects daily life)
+    'environnement', 'climat', 'pollution', 'transport public',
+    'vélo', 'écologie', 'recyclage', 'énergie'
+})
+
+# Keywords that reduce relevance (EXACT same as manual system)
+LOW_RELEVANCE_KEYWORDS = frozenset({
+    'people', 'célébrité', 'star', 'télé-réalité', 'scandale',
+    'paparazzi', 'instagram', 'tiktok', 'influenceur',
+    'gossip', 'rumeur', 'vie privée'
+})
+
+# Importance indicators (EXACT same as manual system)
+HIGH_IMPORTANCE_INDICATORS = frozenset({
+    'breaking', 'urgent', 'alerte', 'important', 'majeur',
+    'historique', 'exceptionnel', 'première fois', 'record',
+    'crise', 'urgence', 'décision', 'annonce', 'officiel'
+})
+
+# Quality indicators (EXACT same as manual system)
+QUALITY_INDICATORS = {
+    'analysis': frozenset({'analyse', 'enquête', 'investigation', 'reportage', 'dossier'}),
+    'expertise': frozenset({'expert', 'spécialiste', 'professeur', 'chercheur', 'selon'}),
+    'sources': frozenset({'source', 'témoin', 'déclaration', 'interview', 'entretien'}),
+    'context': frozenset({'contexte', 'histoire', 'background', 'explication', 'pourquoi'})
+}
+
+# Keyword lists used inline by the manual system's scoring functions
+POOR_QUALITY_INDICATORS = frozenset({'cliquez', 'buzz', 'choc', 'scandaleux', 'incroyable'})
+RELEVANT_CATEGORIES = frozenset({
+    'politique', 'société', 'économie', 'france', 'national',
+    'immigration', 'education', 'culture', 'santé', 'social'
+})
+INTERNATIONAL_INDICATORS = frozenset({'états-unis', 'chine', 'russie', 'ukraine', 'gaza'})
+FRANCE_CONTEXT = frozenset({'france', 'français', 'hexagone', 'paris', 'gouvernement'})
+POLICY_KEYWORDS = frozenset({
+    'gouvernement', 'ministre', 'président', 'assemblée', 'sénat',
+    'loi', 'décret', 'réforme', 'politique', 'décision officielle'
+})
+ECONOMIC_KEYWORDS = frozenset({
+    'économie', 'emploi', 'chômage', 'inflation', 'prix', 'salaire',
+    'impôt', 'budget', 'crise', 'marché', 'entreprise'
+})
+SOCIAL_KEYWORDS = frozenset({
+    'société', 'social', 'manifestation', 'grève', 'éducation',
+    'santé', 'logement', 'transport', 'sécurité', 'justice'
+})
+REPUTABLE_SOURCES = frozenset({
+    'le monde', 'le figaro', 'france info', 'france 24', 'rfi',
+    'libération', 'le parisien', 'afp'
+})
+LOCAL_INDICATORS = frozenset({'commune', 'village', 'petit', 'local'})
+MAJOR_CITIES = frozenset({'paris', 'lyon', 'marseille', 'toulouse', 'nice', 'nantes'})
+
+class _KeywordMatcher:
+    """Substring matcher for one keyword set: a single Aho-Corasick pass over the text
+    with pyahocorasick, `keyword in text` per keyword without it"""
+    
+    def __init__(self, keywords):
+        self.keywords = tuple(keywords)
+        self._automaton = None
+        if ahocorasick is not None and self.keywords:
+            self._automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                self._automaton.add_word(keyword, keyword)
+            self._automaton.make_automaton()
+    
+    def any(self, text: str) -> bool:
+        """Whether any keyword occurs in text"""
+        if self._automaton is None:
+            return any(keyword in text for keyword in self.keywords)
+        for _ in self._automaton.iter(text):
+            return True
+        return False
+
+class _KeywordGroupMatcher:
+    """Finds the keywords of several named groups in one pass: a single Aho-Corasick automaton
+    over all groups with pyahocorasick, `keyword in text` per keyword without it"""
+    
+    def __init__(self, groups: Dict[str, Any]):
+        self.groups = {name: tuple(keywords) for name, keywords in groups.items()}
+        # A keyword spanning the space between two joined fields lies within this many characters
+        # either side of it
+        self._span = max(max((len(k) for keywords in self.groups.values() for k in keywords), default=0) - 1, 1)
+        # Each distinct keyword with the groups it belongs to, so one shared by several groups
+        # (e.g. 'gouvernement') is only searched for once
+        owners: Dict[str, List[str]] = {}
+        for name, keywords in self.groups.items():
+            for keyword in keywords:
+                owners.setdefault(keyword, []).append(name)
+        self._owners = tuple((keyword, tuple(names)) for keyword, names in owners.items())
+        self._automaton = None
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for keyword, names in self._owners:
+                self._automaton.add_word(keyword, (keyword, names))
+            self._automaton.make_automaton()
+    
+    def scan_joined(self, parts: Tuple[str, ...], found: Dict[str, set] = None,
+                    tail: str = None) -> Tuple[Dict[str, set], str]:
+        """group -> keywords occurring in ' '.join(parts), without building the joined string:
+        each part is scanned on its own plus a small window around each joining space.
+        Pass back the returned (found, tail) to extend the same text with more parts"""
+        if found is None:
+            found = {name: set() for name in self.groups}
+        span = self._span
+        
+        if self._automaton is None:
+            # Without the automaton every keyword costs a scan per text, so join once instead
+            text = ' '.join(parts)
+            if tail is not None:
+                text = f"{tail} {text}"
+            for keyword, names in self._owners:
+                if keyword in text:
+                    for name in names:
+                        found[name].add(keyword)
+            return found, text[-span:]
+        
+        iter_matches = self._automaton.iter
+        for part in parts:
+            if tail is None:
+                tail = part[-span:]
+            else:
+                for _, (keyword, names) in iter_matches(f"{tail} {part[:span]}"):
+                    for name in names:
+                        found[name].add(keyword)
+                tail = part[-span:] if len(part) >= span else f"{tail} {part}"[-span:]
+            for _, (keyword, names) in iter_matches(part):
+                for name in names:
+                    found[name].add(keyword)
+        return found, tail
+
+# Match group name of each quality indicator category
+_QUALITY_GROUPS = tuple(f"quality_{category}" for category in QUALITY_INDICATORS)
+
+@lru_cache(maxsize=None)
+def _text_matcher() -> _KeywordGroupMatcher:
+    """Every keyword set checked against the article text, matched together in one scan"""
+    return _KeywordGroupMatcher({
+        **{f"quality_{category}": keywords for category, keywords in QUALITY_INDICATORS.items()},
+        'poor_quality': POOR_QUALITY_INDICATORS,
+        'high_relevance': HIGH_RELEVANCE_KEYWORDS,
+        'medium_relevance': MEDIUM_RELEVANCE_KEYWORDS,
+        'low_relevance': LOW_RELEVANCE_KEYWORDS,
+        'international': INTERNATIONAL_INDICATORS,
+        'france_context': FRANCE_CONTEXT,
+        'high_importance': HIGH_IMPORTANCE_INDICATORS,
+        'policy': POLICY_KEYWORDS,
+        'economic': ECONOMIC_KEYWORDS,
+        'social': SOCIAL_KEYWORDS,
+        'local': LOCAL_INDICATORS,
+        'major_cities': MAJOR_CITIES
+    })
+
+@lru_cache(maxsize=None)
+def _category_matcher() -> _KeywordMatcher:
+    """Relevant categories, matched against the (short) category string"""
+    return _KeywordMatcher(RELEVANT_CATEGORIES)
+
+@lru_cache(maxsize=None)
+def _reputable_source_matcher() -> _KeywordMatcher:
+    """Reputable outlets, matched against the source name"""
+    return _KeywordMatcher(REPUTABLE_SOURCES)
+
+@lru_cache(maxsize=1024)
+def _is_reputable_source(source: str) -> bool:
+    """Whether a (lowercased) source name contains a reputable outlet. Feeds reuse a few dozen
+    names ('le monde politique', ...), so after the first article from a feed this is one lookup"""
+    return source in REPUTABLE_SOURCES or _reputable_source_matcher().any(source)
+
+@dataclass(slots=True)
 class ScoredArticle:
     """Article with quality scores (matches manual system structure)"""
     # Original article data
@@ -44,6 +321,14 @@ class ScoredArticle:
     fast_tracked: bool = False
     urgency_score: float = 0.0
 
+# json fallback hook: any dataclass (a ScoredArticle, or one nested in original_data such as the
+# scraper's ArticleMetadata) -> dict of its fields; json recurses into the values itself.
+# orjson serializes dataclasses natively
+def _dataclass_dict(obj: Any) -> Dict[str, Any]:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 class AutomatedCurator:
     """
     Automated quality curator with EXACT same scoring logic as manual system
@@ -54,80 +339,28 @@ class AutomatedCurator:
         self.curated_articles = []
         self.rejected_articles = []
         
-        # EXACT same keywords as proven manual system
-        self.high_relevance_keywords = {
-            # Immigration & Legal
-            'immigration', 'visa', 'carte de séjour', 'naturalisation', 'préfecture', 
-            'titre de séjour', 'étranger', 'expatrié', 'résidence', 'citoyenneté',
-            
-            # Daily Life & Services
-            'sécurité sociale', 'caf', 'pôle emploi', 'impôts', 'logement', 'santé',
-            'transport', 'sncf', 'ratp', 'école', 'université', 'formation',
-            'banque', 'assurance', 'mutuelle', 'médecin', 'hôpital',
-            
-            # French Culture & Society
-            'culture française', 'tradition', 'laïcité', 'république', 'marianne',
-            'gastronomie', 'cuisine', 'vin', 'fromage', 'baguette', 'café',
-            'festival', 'patrimoine', 'monument', 'musée', 'art français',
-            
-            # Government & Politics (affecting daily life)
-            'gouvernement', 'président', 'assemblée nationale', 'sénat', 'maire',
-            'conseil municipal', 'région', 'département', 'commune', 'élection',
-            'réforme', 'loi', 'décret', 'politique sociale',
-            
-            # Economy & Work
-            'emploi', 'chômage', 'smic', 'salaire', 'retraite', 'cotisation',
-            'entreprise', 'startup', 'innovation', 'économie française', 'crise',
-            'inflation', 'pouvoir d\'achat', 'marché du travail',
-            
-            # Education & Language
-            'français langue étrangère', 'fle', 'apprentissage', 'intégration',
-            'cours de français', 'alliance française',
-            
-            # Regional Life
-            'paris', 'région parisienne', 'province', 'métropole', 'banlieue',
-            'quartier', 'arrondissement', 'ile-de-france'
-        }
-        
-        self.medium_relevance_keywords = {
-            # National Events & News
-            'france', 'français', 'national', 'pays', 'état', 'société',
-            'population', 'citoyen', 'public', 'social', 'communauté',
-            
-            # Current Affairs
-            'actualité', 'information', 'débat', 'polémique', 'manifestation',
-            'grève', 'syndical', 'droit', 'justice', 'tribunal',
-            
-            # Technology & Innovation
-            'technologie', 'numérique', 'internet', 'intelligence artificielle',
-            'startup française', 'innovation française',
-            
-            # Environment (affects daily life)
-            'environnement', 'climat', 'pollution', 'transport public',
-            'vélo', 'écologie', 'recyclage', 'énergie'
-        }
-        
-        # Keywords that reduce relevance (EXACT same as manual system)
-        self.low_relevance_keywords = {
-            'people', 'célébrité', 'star', 'télé-réalité', 'scandale',
-            'paparazzi', 'instagram', 'tiktok', 'influenceur',
-            'gossip', 'rumeur', 'vie privée'
-        }
-        
-        # Importance indicators (EXACT same as manual system)
-        self.high_importance_indicators = {
-            'breaking', 'urgent', 'alerte', 'important', 'majeur',
-            'historique', 'exceptionnel', 'première fois', 'record',
-            'crise', 'urgence', 'décision', 'annonce', 'officiel'
-        }
-        
-        # Quality indicators (EXACT same as manual system)
-        self.quality_indicators = {
-            'analysis': ['analyse', 'enquête', 'investigation', 'reportage', 'dossier'],
-            'expertise': ['expert', 'spécialiste', 'professeur', 'chercheur', 'selon'],
-            'sources': ['source', 'témoin', 'déclaration', 'interview', 'entretien'],
-            'context': ['contexte', 'histoire', 'background', 'explication', 'pourquoi']
-        }
+        # EXACT same keywords as proven manual system (module-level frozensets, see above)
+        self.high_relevance_keywords = HIGH_RELEVANCE_KEYWORDS
+        self.medium_relevance_keywords = MEDIUM_RELEVANCE_KEYWORDS
+        self.low_relevance_keywords = LOW_RELEVANCE_KEYWORDS
+        self.high_importance_indicators = HIGH_IMPORTANCE_INDICATORS
+        self.quality_indicators = QUALITY_INDICATORS
+        
+        self.poor_quality_indicators = POOR_QUALITY_INDICATORS
+        self.relevant_categories = RELEVANT_CATEGORIES
+        self.international_indicators = INTERNATIONAL_INDICATORS
+        self.france_context = FRANCE_CONTEXT
+        self.policy_keywords = POLICY_KEYWORDS
+        self.economic_keywords = ECONOMIC_KEYWORDS
+        self.social_keywords = SOCIAL_KEYWORDS
+        self.reputable_sources = REPUTABLE_SOURCES
+        self.local_indicators = LOCAL_INDICATORS
+        self.major_cities = MAJOR_CITIES
+        
+        # Keyword matchers, built on first use and shared by every curator in the process
+        self._quality_groups = _QUALITY_GROUPS
+        self._text_matcher = _text_matcher()
+        self._category_matcher = _category_matcher()
         
         # Quality thresholds from config
         self.quality_config = AUTOMATION_CONFIG['quality']
@@ -137,199 +370,138 @@ class AutomatedCurator:
     
     def score_quality(self, article: Dict[str, Any]) -> float:
         """Score article quality (0-10) - EXACT same logic as manual system"""
-        score = 5.0  # Base score
-        
-        title = (article.get('title') or '').lower()
-        summary = (article.get('summary') or '').lower()
-        content = (article.get('content') or '').lower()
-        
-        # Combine all text for analysis
-        full_text = f"{title} {summary} {content}"
-        
-        # Quality factors
-        
-        # 1. Content completeness (+2)
-        if content and len(content) > 200:
-            score += 1.0
-        if summary and len(summary) > 50:
-            score += 0.5
-        if article.get('author'):
-            score += 0.5
-        
-        # 2. Writing quality indicators (+2)
-        for category, keywords in self.quality_indicators.items():
-            if any(keyword in full_text for keyword in keywords):
-                score += 0.5
-        
-        # 3. Structure quality (+1)
-        if len(title.split()) >= 5:  # Descriptive title
-            score += 0.3
-        if any(punct in title for punct in [':',  '«', '»']):  # French punctuation
-            score += 0.2
-        if summary and summary != title.lower():  # Unique summary
-            score += 0.5
-        
-        # 4. Language quality (+1)
-        # Check for proper French structure
-        french_patterns = [
-            r'\b(le|la|les|un|une|des)\b',  # Articles
-            r'\b(est|sont|était|sera)\b',   # Common verbs
-            r'\b(avec|dans|pour|sur|par)\b'  # Prepositions
-        ]
-        french_score = sum(1 for pattern in french_patterns if re.search(pattern, full_text))
-        score += min(1.0, french_score * 0.2)
-        
-        # Quality penalties
-        
-        # Poor quality indicators (-2)
-        poor_indicators = ['cliquez', 'buzz', 'choc', 'scandaleux', 'incroyable']
-        if any(indicator in full_text for indicator in poor_indicators):
-            score -= 1.0
-            
-        # Too short content (-1)
-        if len(full_text) < 100:
-            score -= 1.0
-            
-        # All caps title (clickbait) (-0.5)
-        if title.isupper():
-            score -= 0.5
-        
-        return max(0, min(10, score))
+        return self._score_all(article)[0]
     
     def score_relevance(self, article: Dict[str, Any]) -> float:
         """Score relevance (0-10) for expats/immigrants - EXACT same logic as manual system"""
-        score = 3.0  # Base score for French news
-        
-        title = (article.get('title') or '').lower()
-        summary = (article.get('summary') or '').lower()
-        content = (article.get('content') or '').lower()
-        category = (article.get('category') or '').lower()
-        
-        full_text = f"{title} {summary} {content} {category}"
-        
-        # High relevance for expat life (+4)
-        high_matches = sum(1 for keyword in self.high_relevance_keywords 
-                          if keyword in full_text)
-        score += min(4.0, high_matches * 0.8)
-        
-        # Medium relevance for French society (+2)
-        medium_matches = sum(1 for keyword in self.medium_relevance_keywords 
-                           if keyword in full_text)
-        score += min(2.0, medium_matches * 0.3)
-        
-        # Category-based relevance (+1)
-        relevant_categories = [
-            'politique', 'société', 'économie', 'france', 'national',
-            'immigration', 'education', 'culture', 'santé', 'social'
-        ]
-        if any(cat in category for cat in relevant_categories):
-            score += 1.0
-        
-        # Penalties for low relevance (-3)
-        low_matches = sum(1 for keyword in self.low_relevance_keywords 
-                         if keyword in full_text)
-        score -= min(3.0, low_matches * 1.0)
-        
-        # International news penalty (unless affects France) (-1)
-        international_indicators = ['états-unis', 'chine', 'russie', 'ukraine', 'gaza']
-        france_context = ['france', 'français', 'hexagone', 'paris', 'gouvernement']
-        
-        if (any(indicator in full_text for indicator in international_indicators) and
-            not any(context in full_text for context in france_context)):
-            score -= 1.0
-        
-        return max(0, min(10, score))
+        return self._score_all(article)[1]
     
     def score_importance(self, article: Dict[str, Any]) -> float:
         """Score importance (0-10) - EXACT same logic as manual system"""
-        score = 4.0  # Base score
-        
+        return self._score_all(article)[2]
+    
+    def _score_all(self, article: Dict[str, Any]) -> Tuple[float, float, float]:
+        """Quality, relevance and importance of one article"""
+        return score_features(self._score_features(article))
+    
+    def _score_features(self, article: Dict[str, Any]) -> List[Any]:
+        """The inputs of the manual system's scoring formulas (columns F_* of _curator_numba):
+        fields are lowercased once and all keyword sets are matched in a single scan of the text.
+        The manual system analyses "title summary content" as one string; the fields are scanned
+        in place instead of copying them into it"""
         title = (article.get('title') or '').lower()
         summary = (article.get('summary') or '').lower()
         content = (article.get('content') or '').lower()
+        category = (article.get('category') or '').lower()
         source = (article.get('source_name') or '').lower()
         
-        full_text = f"{title} {summary} {content}"
-        
-        # Breaking news/urgent (+2)
-        if any(indicator in full_text for indicator in self.high_importance_indicators):
-            score += 2.0
-        
-        # Government/policy news (+2)
-        policy_keywords = [
-            'gouvernement', 'ministre', 'président', 'assemblée', 'sénat',
-            'loi', 'décret', 'réforme', 'politique', 'décision officielle'
-        ]
-        if any(keyword in full_text for keyword in policy_keywords):
-            score += 2.0
-        
-        # Economic impact (+1.5)
-        economic_keywords = [
-            'économie', 'emploi', 'chômage', 'inflation', 'prix', 'salaire',
-            'impôt', 'budget', 'crise', 'marché', 'entreprise'
-        ]
-        if any(keyword in full_text for keyword in economic_keywords):
-            score += 1.5
-        
-        # Social impact (+1.5)
-        social_keywords = [
-            'société', 'social', 'manifestation', 'grève', 'éducation',
-            'santé', 'logement', 'transport', 'sécurité', 'justice'
-        ]
-        if any(keyword in full_text for keyword in social_keywords):
-            score += 1.5
-        
-        # Source reputation (+1)
-        reputable_sources = [
-            'le monde', 'le figaro', 'france info', 'france 24', 'rfi',
-            'libération', 'le parisien', 'afp'
-        ]
-        if any(source_name in source for source_name in reputable_sources):
-            score += 1.0
-        
-        # Local/regional penalty (unless major city) (-1)
-        local_indicators = ['commune', 'village', 'petit', 'local']
-        major_cities = ['paris', 'lyon', 'marseille', 'toulouse', 'nice', 'nantes']
-        
-        if (any(indicator in full_text for indicator in local_indicators) and
-            not any(city in full_text for city in major_cities)):
-            score -= 1.0
-        
-        return max(0, min(10, score))
+        hits, tail = self._text_matcher.scan_joined((title, summary, content))
+        
+        def in_full_text(group: str) -> bool:
+            return bool(hits[group])
+        
+        # Check for proper French structure (articles, common verbs, prepositions). The patterns
+        # are single words, so none can span the space between two fields
+        seen = set()
+        for text in (title, summary, content):
+            for match in _FRENCH_COMBINED.finditer(text):
+                seen.add(match.lastgroup)
+                if len(seen) == _FRENCH_KINDS:
+                    break
+            if len(seen) == _FRENCH_KINDS:
+                break
+        
+        f = [0] * N_FEATURES
+        
+        # Quality: content completeness, writing quality, structure, language, penalties
+        f[F_LONG_CONTENT] = bool(content) and len(content) > 200
+        f[F_LONG_SUMMARY] = bool(summary) and len(summary) > 50
+        f[F_HAS_AUTHOR] = bool(article.get('author'))
+        f[F_QUALITY_GROUPS] = sum(1 for group in self._quality_groups if in_full_text(group))
+        f[F_DESCRIPTIVE_TITLE] = len(title.split()) >= 5
+        f[F_FRENCH_PUNCT] = any(punct in title for punct in [':',  '«', '»'])
+        f[F_UNIQUE_SUMMARY] = bool(summary) and summary != title.lower()
+        f[F_FRENCH_KINDS] = len(seen)
+        f[F_POOR_QUALITY] = in_full_text('poor_quality')
+        f[F_SHORT_TEXT] = len(title) + len(summary) + len(content) + 2 < 100
+        f[F_CAPS_TITLE] = title.isupper()
+        
+        # Importance: topic indicators, source reputation, local penalty
+        f[F_HIGH_IMPORTANCE] = in_full_text('high_importance')
+        f[F_POLICY] = in_full_text('policy')
+        f[F_ECONOMIC] = in_full_text('economic')
+        f[F_SOCIAL] = in_full_text('social')
+        f[F_REPUTABLE_SOURCE] = _is_reputable_source(source)
+        f[F_LOCAL] = in_full_text('local') and not in_full_text('major_cities')
+        
+        # Relevance reads the category too, so extend the hits to "title summary content category"
+        self._text_matcher.scan_joined((category,), hits, tail)
+        
+        # Relevance: keyword counts over text + category, category match, international penalty
+        f[F_HIGH_RELEVANCE] = len(hits['high_relevance'])
+        f[F_MEDIUM_RELEVANCE] = len(hits['medium_relevance'])
+        f[F_RELEVANT_CATEGORY] = self._category_matcher.any(category)
+        f[F_LOW_RELEVANCE] = len(hits['low_relevance'])
+        f[F_INTERNATIONAL] = bool(hits['international']) and not hits['france_context']
+        
+        return f
     
     def calculate_similarity(self, text1: str, text2: str) -> float:
-        """Calculate similarity between two texts (0-1) - same as manual system"""
-        return SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
+        """Calculate similarity between two texts (0-1) - manual system's difflib ratio, or
+        rapidfuzz's when installed"""
+        return _similarity(text1.lower(), text2.lower())
     
     def find_duplicates(self, articles: List[Dict[str, Any]], 
                        similarity_threshold: float = 0.7) -> List[List[int]]:
-        """Find duplicate articles - same logic as manual system"""
-        duplicate_groups = []
-        processed_indices = set()
-        
-        for i, article1 in enumerate(articles):
-            if i in processed_indices:
-                continue
-                
-            title1 = article1.get('title', '')
-            current_group = [i]
-            processed_indices.add(i)
-            
-            for j, article2 in enumerate(articles[i+1:], i+1):
-                if j in processed_indices:
-                    continue
-                    
-                title2 = article2.get('title', '')
-                similarity = self.calculate_similarity(title1, title2)
+        """Find duplicate articles: groups are the connected components of title pairs above the
+        similarity threshold (with datasketch, only pairs that MinHash LSH flags are compared)"""
+        # Lowercase each title once rather than twice per compared pair
+        titles = [(article.get('title') or '').lower() for article in articles]
+        candidates = self._duplicate_candidates(titles)
+        
+        # Union-find over similar pairs (path halving)
+        parent = list(range(len(titles)))
+        
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        for i, title1 in enumerate(titles):
+            later = range(i + 1, len(titles)) if candidates is None else sorted(candidates[i])
+            for j in later:
+                root_i, root_j = find(i), find(j)
+                if root_i == root_j:
+                    continue  # Already grouped through another pair
                 
-                if similarity > similarity_threshold:
-                    current_group.append(j)
-                    processed_indices.add(j)
-            
-            if len(current_group) > 1:
-                duplicate_groups.append(current_group)
+                if _similarity(title1, titles[j]) > similarity_threshold:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
         
-        return duplicate_groups
+        # Components with more than one article, each listed in index order
+        groups = defaultdict(list)
+        for i in range(len(titles)):
+            groups[find(i)].append(i)
+        
+        return [group for group in groups.values() if len(group) > 1]
+    
+    def _duplicate_candidates(self, titles: List[str]) -> Any:
+        """For each index, the later indices whose (lowercased) titles share enough shingles to be
+        worth a similarity check; None means compare every pair (no datasketch, or a small batch)"""
+        if MinHashLSH is None or len(titles) < self.quality_config['duplicate_lsh_min_articles']:
+            return None
+        
+        lsh = MinHashLSH(threshold=self.quality_config['duplicate_lsh_threshold'], num_perm=_DUPLICATE_NUM_PERM)
+        signatures = []
+        for i, title in enumerate(titles):
+            size = _DUPLICATE_SHINGLE_SIZE
+            shingles = {title[k:k + size] for k in range(max(1, len(title) - size + 1))}
+            signature = MinHash(num_perm=_DUPLICATE_NUM_PERM)
+            signature.update_batch([shingle.encode('utf-8') for shingle in shingles])
+            lsh.insert(i, signature)
+            signatures.append(signature)
+        
+        return [{j for j in lsh.query(signature) if j > i} for i, signature in enumerate(signatures)]
     
     def select_best_duplicate(self, articles: List[Dict[str, Any]], 
                             scores: List[float], indices: List[int]) -> int:
@@ -358,9 +530,13 @@ class AutomatedCurator:
         else:
             article_data = article
         
-        quality = self.score_quality(article_data)
-        relevance = self.score_relevance(article_data)
-        importance = self.score_importance(article_data)
+        return self._scored_article(article_data, *self._score_all(article_data))
+    
+    def _scored_article(self, article_data: Dict[str, Any], quality: float,
+                        relevance: float, importance: float,
+                        curation_id: Optional[str] = None,
+                        curated_at: Optional[str] = None) -> ScoredArticle:
+        """Wrap an article and its three scores (id and timestamp generated unless given)"""
         total = quality + relevance + importance
         
         # Extract urgency score if available (from smart scraper)
@@ -372,8 +548,8 @@ class AutomatedCurator:
             relevance_score=relevance,
             importance_score=importance,
             total_score=total,
-            curation_id=str(uuid.uuid4()),
-            curated_at=datetime.now(timezone.utc).isoformat(),
+            curation_id=curation_id or str(uuid.uuid4()),
+            curated_at=curated_at or datetime.now(timezone.utc).isoformat(),
             urgency_score=urgency_score
         )
     
@@ -412,11 +588,15 @@ class AutomatedCurator:
             else:
                 article_dicts.append(article)
         
-        # Score all articles
-        scored_articles = []
-        for article in article_dicts:
-            scored_article = self.score_single_article(article)
-            scored_articles.append(scored_article)
+        # Score all articles: extract each one's features, then run the formulas over the whole batch
+        # One timestamp for the whole run, ids generated up front
+        features = self._extract_features(article_dicts)
+        curated_at = datetime.now(timezone.utc).isoformat()
+        curation_ids = [str(uuid.uuid4()) for _ in article_dicts]
+        scored_articles = [
+            self._scored_article(article, *scores, curation_id=curation_id, curated_at=curated_at)
+            for article, scores, curation_id in zip(article_dicts, score_batch(features), curation_ids)
+        ]
         
         # Find and handle duplicates
         duplicate_groups = self.find_duplicates(article_dicts)
@@ -462,6 +642,21 @@ class AutomatedCurator:
         
         return curated
     
+    def _extract_features(self, article_dicts: List[Dict[str, Any]]) -> List[List[float]]:
+        """Feature rows for a batch, spread over scoring_workers threads when configured"""
+        workers = self.quality_config['scoring_workers']
+        if workers <= 1 or len(article_dicts) <= self.quality_config['scoring_chunk_size']:
+            return [self._score_features(article) for article in article_dicts]
+        
+        # Matchers and the French regex are read-only after construction, so threads can share them
+        chunk_size = self.quality_config['scoring_chunk_size']
+        chunks = [article_dicts[i:i + chunk_size] for i in range(0, len(article_dicts), chunk_size)]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='curator-score') as executor:
+            return [row for rows in executor.map(self._score_chunk, chunks) for row in rows]
+    
+    def _score_chunk(self, article_dicts: List[Dict[str, Any]]) -> List[List[float]]:
+        return [self._score_features(article) for article in article_dicts]
+    
     def save_curated_articles(self, filename: str = None) -> str:
         """Save curated articles with metadata"""
         if filename is None:
@@ -471,22 +666,48 @@ class AutomatedCurator:
         # Ensure directory exists
         os.makedirs(os.path.dirname(filename), exist_ok=True)
         
-        # Calculate statistics
+        # Calculate statistics: min/max/sum of every score (and the fast-tracked count) in one pass
+        fast_tracked = 0
         if self.curated_articles:
-            scores = {
-                'quality': [a.quality_score for a in self.curated_articles],
-                'relevance': [a.relevance_score for a in self.curated_articles],
-                'importance': [a.importance_score for a in self.curated_articles],
-                'total': [a.total_score for a in self.curated_articles]
-            }
+            first = self.curated_articles[0]
+            q_min = q_max = first.quality_score
+            r_min = r_max = first.relevance_score
+            i_min = i_max = first.importance_score
+            t_min = t_max = first.total_score
+            q_sum = r_sum = i_sum = t_sum = 0
             
-            stats = {}
-            for score_type, values in scores.items():
-                stats[score_type] = {
-                    'min': min(values),
-                    'max': max(values),
-                    'avg': sum(values) / len(values)
-                }
+            for a in self.curated_articles:
+                q, r, i, t = a.quality_score, a.relevance_score, a.importance_score, a.total_score
+                q_sum += q
+                r_sum += r
+                i_sum += i
+                t_sum += t
+                if q < q_min:
+                    q_min = q
+                elif q > q_max:
+                    q_max = q
+                if r < r_min:
+                    r_min = r
+                elif r > r_max:
+                    r_max = r
+                if i < i_min:
+                    i_min = i
+                elif i > i_max:
+                    i_max = i
+                if t < t_min:
+                    t_min = t
+                elif t > t_max:
+                    t_max = t
+                if a.fast_tracked:
+                    fast_tracked += 1
+            
+            n = len(self.curated_articles)
+            stats = {
+                'quality': {'min': q_min, 'max': q_max, 'avg': q_sum / n},
+                'relevance': {'min': r_min, 'max': r_max, 'avg': r_sum / n},
+                'importance': {'min': i_min, 'max': i_max, 'avg': i_sum / n},
+                'total': {'min': t_min, 'max': t_max, 'avg': t_sum / n}
+            }
         else:
             stats = {}
         
@@ -497,7 +718,7 @@ class AutomatedCurator:
                 "curator_version": "Automated Curator 1.0",
                 "automation_system": "Better French Max Automated System",
                 "quality_threshold": self.quality_config['min_total_score'],
-                "fast_tracked_articles": len([a for a in self.curated_articles if a.fast_tracked]),
+                "fast_tracked_articles": fast_tracked,
                 "statistics": stats,
                 "scoring_system": {
                     "quality": "0-10 based on content completeness, writing quality, structure",
@@ -506,11 +727,12 @@ class AutomatedCurator:
                     "total": "Sum of quality + relevance + importance (0-30)"
                 }
             },
-            "curated_articles": [asdict(article) for article in self.curated_articles]
+            # Encoded as dataclasses, recursing into any nested in original_data like asdict did
+            "curated_articles": self.curated_articles
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_dumps_pretty(data))
         
         logger.info(f"💾 Curated articles saved: {filename}")
         return filename
@@ -537,11 +759,12 @@ class AutomatedCurator:
                 "rejection_summary": rejection_reasons,
                 "curator_version": "Automated Curator 1.0"
             },
-            "rejected_articles": [asdict(article) for article in self.rejected_articles]
+            # Encoded as dataclasses, recursing into any nested in original_data like asdict did
+            "rejected_articles": self.rejected_articles
         }
         
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        with open(filename, 'wb') as f:
+            f.write(_dumps_pretty(data))
         
         logger.info(f"🗑️ Rejected articles saved: {filename}")
         return filename
@@ -89,11 +89,7 @@ class MasterScheduler:
             # Initialize AI processor if enabled
             if self.config['cost']['enable_realtime_ai_processing']:
                 try:
-                    import importlib.util
-                    spec = importlib.util.spec_from_file_location("AI_Engine", os.path.join(os.path.dirname(__file__), "AI-Engine.py"))
-                    AI_Engine = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(AI_Engine)
-                    CostOptimizedAIProcessor = AI_Engine.CostOptimizedAIProcessor
+                    from ai_engine import CostOptimizedAIProcessor
                     self.ai_processor = CostOptimizedAIProcessor()
                     logger.info("✅ AI processor enabled for automation")
                 except ImportError as e:
@@ -26,7 +26,13 @@ from difflib import SequenceMatcher
 
 # Add config directory to path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'config'))
-from automation import AUTOMATION_CONFIG
+from automation import (
+    AUTOMATION_CONFIG, BREAKING_NEWS_TIMEFRAME_SEC, REGULAR_UPDATE_TIMEFRAME_SEC,
+    MAX_ARTICLE_AGE_SEC, DEDUP_CACHE_DURATION_SEC
+)
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from _simhash_numba import simhash_accum, warm_up as warm_up_simhash
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -82,6 +88,24 @@ class NewsArticle:
     # Processing tracking
     metadata: Optional[ArticleMetadata] = None
 
+# Max differing bits between two title fingerprints to count as near-duplicates
+SIMHASH_DUPLICATE_DISTANCE = 4
+
+def simhash64(text: str, shingle_size: int = 3) -> int:
+    """64-bit SimHash (Charikar) fingerprint over character shingles of text"""
+    text = ' '.join(re.sub(r'[^\w\s]', ' ', text.lower()).split())
+    shingles = {text[i:i + shingle_size] for i in range(max(1, len(text) - shingle_size + 1))}
+    
+    return simhash_accum(
+        int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'little')
+        for shingle in shingles
+    )
+
+def is_near_duplicate(fingerprint: int, seen_fingerprints: List[int],
+                      max_distance: int = SIMHASH_DUPLICATE_DISTANCE) -> bool:
+    """Check a fingerprint against accepted ones by Hamming distance"""
+    return any((fingerprint ^ seen).bit_count() <= max_distance for seen in seen_fingerprints)
+
 class EnhancedDeduplicator:
     """Advanced deduplication system for articles"""
     
@@ -132,13 +156,12 @@ class EnhancedDeduplicator:
             # Check title and content similarity
             title_threshold = self.config['title_similarity_threshold']
             content_threshold = self.config['similarity_threshold']
+            oldest_allowed = time.time() - DEDUP_CACHE_DURATION_SEC
             
             for cached_hash, metadata in self.article_cache.items():
                 # Skip old articles
                 first_seen = datetime.fromisoformat(metadata.first_seen.replace('Z', '+00:00'))
-                age_hours = (datetime.now(timezone.utc) - first_seen).total_seconds() / 3600
-                
-                if age_hours > self.config['cache_duration_hours']:
+                if first_seen.timestamp() < oldest_allowed:
                     continue
                 
                 # Get cached article for comparison (simplified - in real implementation would store more data)
@@ -181,15 +204,12 @@ class EnhancedDeduplicator:
     def cleanup_old_cache(self):
         """Remove old entries from cache"""
         with self.cache_lock:
-            current_time = datetime.now(timezone.utc)
-            max_age_hours = self.config['cache_duration_hours']
+            oldest_allowed = time.time() - DEDUP_CACHE_DURATION_SEC
             
             to_remove = []
             for cache_hash, metadata in self.article_cache.items():
                 first_seen = datetime.fromisoformat(metadata.first_seen.replace('Z', '+00:00'))
-                age_hours = (current_time - first_seen).total_seconds() / 3600
-                
-                if age_hours > max_age_hours:
+                if first_seen.timestamp() < oldest_allowed:
                     to_remove.append(cache_hash)
             
             for cache_hash in to_remove:
@@ -280,16 +300,20 @@ class SmartScraper:
         """Create content hash for deduplication (delegated to deduplicator)"""
         return self.deduplicator.create_content_hash(title, summary, content)
 
-    def get_time_filter(self, scan_type: str) -> datetime:
-        """Get appropriate time filter based on scan type"""
+    def get_time_cutoff_ts(self, scan_type: str) -> float:
+        """Get the oldest allowed publish time (epoch seconds) for a scan type"""
         if scan_type == "breaking":
-            hours = self.scraping_config['breaking_news_timeframe_hours']
+            max_age = BREAKING_NEWS_TIMEFRAME_SEC
         elif scan_type == "regular":
-            hours = self.scraping_config['regular_update_timeframe_hours']
+            max_age = REGULAR_UPDATE_TIMEFRAME_SEC
         else:
-            hours = self.scraping_config['max_article_age_hours']
+            max_age = MAX_ARTICLE_AGE_SEC
         
-        return datetime.now(timezone.utc) - timedelta(hours=hours)
+        return time.time() - max_age
+
+    def get_time_filter(self, scan_type: str) -> datetime:
+        """Get appropriate time filter based on scan type"""
+        return datetime.fromtimestamp(self.get_time_cutoff_ts(scan_type), timezone.utc)
 
     def apply_article_limits(self, articles: List[NewsArticle], scan_type: str) -> List[NewsArticle]:
         """Apply intelligent article limits based on scan type and source priority"""
@@ -518,8 +542,8 @@ class SmartScraper:
             self.source_reliability[source_name] = self.source_reliability.get(source_name, 0) + 1
             self.source_last_success[source_name] = datetime.now(timezone.utc).isoformat()
             
-            # Get appropriate time filter
-            time_cutoff = self.get_time_filter(scan_type)
+            # Get appropriate time filter (epoch seconds)
+            time_cutoff = self.get_time_cutoff_ts(scan_type)
             
             # Process entries with intelligent limits
             processed_count = 0
@@ -545,7 +569,7 @@ class SmartScraper:
                             if article_date.tzinfo is None:
                                 article_date = article_date.replace(tzinfo=timezone.utc)
                             
-                            if article_date < time_cutoff:
+                            if article_date.timestamp() < time_cutoff:
                                 include_article = False
                                 logger.debug(f"⏰ Article too old: {article.title[:30]}...")
                         except:
@@ -13,6 +13,7 @@ import logging
 from datetime import datetime, timezone, timedelta
 from typing import List, Dict, Any, Optional
 from pathlib import Path
+from dataclasses import fields, is_dataclass
 import hashlib
 
 # Add config directory to path
@@ -134,12 +135,16 @@ class LiveWebsiteUpdater:
     
     def _prepare_article_for_website(self, scored_article) -> Dict[str, Any]:
         """Prepare a scored article for website display"""
-        if hasattr(scored_article, '__dict__'):
-            article_data = scored_article.__dict__
-            original = article_data.get('original_data', {})
-        else:
+        if isinstance(scored_article, dict):
             article_data = scored_article
             original = article_data.get('original_data', article_data)
+        else:
+            # ScoredArticle is a slotted dataclass (no __dict__)
+            if is_dataclass(scored_article):
+                article_data = {f.name: getattr(scored_article, f.name) for f in fields(scored_article)}
+            else:
+                article_data = vars(scored_article)
+            original = article_data.get('original_data', {})
         
         return {
             'title': original.get('title', ''),